@@ -16,11 +16,21 @@ from webdriver_manager.microsoft import EdgeChromiumDriverManager
 import pyautogui
 import aiohttp
 import asyncio
+import orjson
 from .token_discovery import TokenMetrics, TokenDiscovery
 import json
 
 logger = logging.getLogger(__name__)
 
+def fib_backoff(base: float = 0.05, max_duration: float = 2.0):
+    """Yield Fibonacci-spaced retry delays until max_duration would be exceeded."""
+    delay, next_delay = base, base
+    total = 0.0
+    while total + delay <= max_duration:
+        yield delay
+        total += delay
+        delay, next_delay = next_delay, delay + next_delay
+
 class PhotonTrader:
     """Photon DEX trading bot that interacts with the web interface."""
     
@@ -41,8 +51,32 @@ class PhotonTrader:
         self.helius_enabled = self.rpc_config['helius']['enabled']
         self.helius_api_key = self.rpc_config['helius']['api_key']
         
+        # Request headers are constant per endpoint kind, build them once
+        self._rpc_headers = {"Content-Type": "application/json"}
+        self._helius_headers = {
+            **self._rpc_headers,
+            "Authorization": f"Bearer {self.helius_api_key}"
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Consecutive failures per endpoint; endpoints that keep failing are
+        # skipped until skip_until (monotonic) so calls don't stall on them
+        self._endpoint_health: Dict[str, dict] = {
+            endpoint: {'fails': 0, 'skip_until': 0.0}
+            for endpoint in self.rpc_endpoints
+        }
+        
         self._validate_wallet_addresses()
         
+    async def __aenter__(self):
+        """Async context manager enter"""
+        await self._get_session()
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.cleanup()
+        
     def _validate_wallet_addresses(self):
         """Validate wallet addresses in config."""
         wallet_pattern = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$')
@@ -255,8 +289,7 @@ class PhotonTrader:
         """Initialize RPC connection with Helius."""
         try:
             # Create aiohttp session for RPC
-            if not hasattr(self, '_session'):
-                self._session = aiohttp.ClientSession()
+            await self._get_session()
                 
             # Test Helius connection first
             if self.helius_enabled:
@@ -330,72 +363,144 @@ class PhotonTrader:
             
     async def check_rpc_connection(self) -> bool:
         """Check RPC connection with fallback options."""
-        for i, endpoint in enumerate(self.rpc_endpoints):
-            try:
-                # Try to get recent blockhash to test connection
-                response = await self.make_rpc_request(
-                    endpoint,
-                    "getRecentBlockhash",
-                    []
-                )
-                
-                if response and 'result' in response:
-                    self.current_rpc = i
-                    logger.info(f"Connected to RPC endpoint: {endpoint}")
-                    return True
-                    
-            except Exception as e:
-                logger.warning(f"Failed to connect to RPC {endpoint}: {str(e)}")
-                continue
-                
+        # Try to get recent blockhash to test connection
+        index, response = await self.race_rpc_request("getRecentBlockhash", [])
+        
+        if index is not None:
+            self.current_rpc = index
+            logger.info(f"Connected to RPC endpoint: {self.rpc_endpoints[index]}")
+            return True
+            
         logger.error("All RPC endpoints failed")
         return False
         
+    async def race_rpc_request(self, method: str, params: list) -> Tuple[Optional[int], Optional[dict]]:
+        """Send an RPC request to all endpoints and return the first valid response.
+        
+        Fallback endpoints are launched hedge_delay_ms apart so a healthy
+        primary usually answers before the backups are hit. Endpoints in
+        cooldown are not tried. Returns the index of the winning endpoint and
+        its response, or (None, None).
+        """
+        hedge_delay = self.rpc_config.get('hedge_delay_ms', 150) / 1000
+        
+        candidates = [
+            (i, endpoint) for i, endpoint in enumerate(self.rpc_endpoints)
+            if self._endpoint_available(endpoint)
+        ]
+        
+        async def attempt(position: int, index: int, endpoint: str):
+            if position:
+                await asyncio.sleep(hedge_delay * position)
+            return index, await self.make_rpc_request(endpoint, method, params)
+            
+        tasks = [
+            asyncio.create_task(attempt(position, i, endpoint))
+            for position, (i, endpoint) in enumerate(candidates)
+        ]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception():
+                        logger.warning("RPC %s failed: %s", method, task.exception())
+                        continue
+                    index, response = task.result()
+                    if response and 'result' in response:
+                        return index, response
+            return None, None
+        finally:
+            for task in pending:
+                task.cancel()
+                
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared RPC session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.rpc_config['timeout'])
+            )
+        return self._session
+        
+    def _endpoint_available(self, endpoint: str) -> bool:
+        """Check whether an endpoint is outside its failure cooldown."""
+        health = self._endpoint_health.get(endpoint)
+        return not health or time.monotonic() >= health['skip_until']
+        
+    def _record_endpoint_result(self, endpoint: str, success: bool):
+        """Update endpoint health, backing off after repeated failures."""
+        health = self._endpoint_health.setdefault(endpoint, {'fails': 0, 'skip_until': 0.0})
+        if success:
+            health['fails'] = 0
+            health['skip_until'] = 0.0
+            return
+            
+        health['fails'] += 1
+        if health['fails'] >= 3:
+            cooldown = min(60, 2 ** health['fails'])
+            health['skip_until'] = time.monotonic() + cooldown
+            logger.warning("Skipping RPC endpoint %s for %ss after %s failures", endpoint, cooldown, health['fails'])
+            
     async def make_rpc_request(self, endpoint: str, method: str, params: list) -> Optional[dict]:
         """Make RPC request with retry logic and Helius support."""
+        if not self._endpoint_available(endpoint):
+            return None
+            
         max_retries = self.rpc_config['retries']
-        timeout = self.rpc_config['timeout']
-        retry_delay = 1
-        
-        headers = {
-            "Content-Type": "application/json"
-        }
+        delays = fib_backoff(
+            self.rpc_config.get('retry_base_delay', 0.05),
+            self.rpc_config.get('retry_max_duration', 2.0)
+        )
         
         # Add Helius-specific headers if using Helius endpoint
         if self.helius_enabled and "helius" in endpoint:
-            headers["Authorization"] = f"Bearer {self.helius_api_key}"
+            headers = self._helius_headers
+        else:
+            headers = self._rpc_headers
+            
+        # Serialize once, not on every retry
+        payload = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": method,
+            "params": params
+        })
         
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        endpoint,
-                        json={
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": method,
-                            "params": params
-                        },
-                        headers=headers,
-                        timeout=timeout
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            
-                            # Check for Helius enhanced logs if enabled
-                            if (self.helius_enabled and 
-                                self.rpc_config['helius']['enhanced_logs'] and 
-                                'result' in result):
-                                await self._process_helius_logs(result)
-                                
-                            return result
+                session = await self._get_session()
+                async with session.post(endpoint, data=payload, headers=headers) as response:
+                    if response.status == 200:
+                        result = orjson.loads(await response.read())
+                        
+                        # Check for Helius enhanced logs if enabled
+                        if (self.helius_enabled and 
+                            self.rpc_config['helius']['enhanced_logs'] and 
+                            'result' in result):
+                            await self._process_helius_logs(result)
                             
-            except Exception as e:
-                logger.warning(f"RPC request failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
+                        self._record_endpoint_result(endpoint, True)
+                        return result
+                        
+                    logger.warning("RPC request returned HTTP %s (attempt %d/%d)", response.status, attempt + 1, max_retries)
                     
+            except Exception as e:
+                logger.warning("RPC request failed (attempt %d/%d): %s", attempt + 1, max_retries, e)
+                
+            # Transient failures cost a short, growing delay rather than an error
+            delay = next(delays, None)
+            if delay is None or attempt == max_retries - 1:
+                break
+            await asyncio.sleep(delay)
+            
+        self._record_endpoint_result(endpoint, False)
         return None
         
     async def _process_helius_logs(self, result: dict):
@@ -435,7 +540,7 @@ class PhotonTrader:
                     amount = log.get('amount')
                     from_address = log.get('from')
                     to_address = log.get('to')
-                    logger.info(f"Token transfer: {amount} from {from_address} to {to_address}")
+                    logger.info("Token transfer: %s from %s to %s", amount, from_address, to_address)
                     
         except Exception as e:
             logger.error(f"Error handling token program log: {str(e)}")
@@ -449,7 +554,7 @@ class PhotonTrader:
                     # Process swap logs
                     amount_in = log.get('amountIn')
                     amount_out = log.get('amountOut')
-                    logger.info(f"Swap: {amount_in} -> {amount_out}")
+                    logger.info("Swap: %s -> %s", amount_in, amount_out)
                     
         except Exception as e:
             logger.error(f"Error handling AMM program log: {str(e)}")
@@ -1188,7 +1293,7 @@ class PhotonTrader:
                     self.driver = None
                     
             # Close any active RPC sessions
-            if hasattr(self, '_session') and self._session:
+            if self._session:
                 try:
                     await self._session.close()
                 except Exception as e:
@@ -1,15 +1,26 @@
 """Wallet manager for handling Solana wallets and transactions."""
 
+import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import time
+import aiohttp
+import orjson
+from typing import Dict, Any, Optional, List, Tuple
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 import solders.system_program as system_program
 from solders.transaction import Transaction
+from spl.token.instructions import get_associated_token_address
 
 logger = logging.getLogger(__name__)
 
+# getMultipleAccounts accepts at most 100 pubkeys per call
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# Keep JSON-RPC batches small enough to finish well inside the RPC timeout
+MAX_BATCH_REQUESTS = 50
+
 class WalletManager:
     """Manages Solana wallets and transactions."""
     
@@ -20,6 +31,15 @@ class WalletManager:
         self.initialized = False
         self._connected = False
         
+        # Short-lived balance cache: (value, monotonic expiry)
+        self._balance_cache: Optional[Tuple[float, float]] = None
+        self.balance_cache_ttl = config.get('wallet', {}).get('balance_cache_ms', 500) / 1000
+        
+        # Raw HTTP session for JSON-RPC batch requests
+        self.rpc_url = config.get('rpc', {}).get('primary')
+        self.rpc_timeout = config.get('rpc', {}).get('timeout', 30)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
     async def initialize(self, rpc_manager):
         """Initialize wallet manager."""
         try:
@@ -53,18 +73,20 @@ class WalletManager:
             
             if os.path.exists(keypair_path):
                 logger.info("Loading existing keypair...")
-                with open(keypair_path, 'r') as f:
-                    import json
-                    keypair_bytes = bytes(json.load(f))
-                    self.keypair = Keypair.from_bytes(keypair_bytes)
+                with open(keypair_path, 'rb') as f:
+                    raw = f.read()
+                # Accept raw 64-byte keypairs as well as the solana-keygen JSON array
+                if len(raw) == 64:
+                    self.keypair = Keypair.from_bytes(raw)
+                else:
+                    self.keypair = Keypair.from_bytes(bytes(json.loads(raw)))
             else:
                 logger.info("Generating new keypair...")
                 self.keypair = Keypair()
                 # Save keypair for future use
                 os.makedirs(os.path.dirname(keypair_path), exist_ok=True)
                 with open(keypair_path, 'w') as f:
-                    import json
-                    json.dump(list(self.keypair.secret()), f)
+                    json.dump(list(bytes(self.keypair)), f)
                 
             logger.info(f"Wallet public key: {self.keypair.pubkey()}")
             
@@ -92,10 +114,23 @@ class WalletManager:
             self._connected = False
             raise
             
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session used for batch requests."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.rpc_timeout)
+            )
+        return self._session
+        
     async def cleanup(self):
         """Clean up resources."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
         self.initialized = False
         self._connected = False
+        self._balance_cache = None
         
     def is_connected(self) -> bool:
         """Check if wallet is connected."""
@@ -107,10 +142,13 @@ class WalletManager:
             if not self.keypair:
                 raise Exception("Wallet not initialized")
                 
+            if self._balance_cache and time.monotonic() < self._balance_cache[1]:
+                return self._balance_cache[0]
+                
             response = await self.rpc.client.get_balance(self.keypair.pubkey())
-            if not response.value:
-                return 0.0
-            return response.value / 1e9  # Convert lamports to SOL
+            balance = response.value / 1e9 if response.value else 0.0  # Convert lamports to SOL
+            self._balance_cache = (balance, time.monotonic() + self.balance_cache_ttl)
+            return balance
             
         except Exception as e:
             logger.error(f"Failed to get balance: {str(e)}")
@@ -144,6 +182,109 @@ class WalletManager:
             logger.error(f"Failed to get token balance: {str(e)}")
             return 0.0
             
+    async def get_token_balances(self, token_mints: List[str]) -> Dict[str, float]:
+        """Get associated token account balances for many SPL tokens.
+
+        Derives the associated token account for each mint and fetches them
+        with getMultipleAccounts, so N mints cost ceil(N / 100) round-trips
+        instead of 2N.
+        """
+        balances = {mint: 0.0 for mint in token_mints}
+        try:
+            if not self.keypair:
+                raise Exception("Wallet not initialized")
+                
+            owner = self.keypair.pubkey()
+            accounts = [
+                get_associated_token_address(owner, Pubkey.from_string(mint))
+                for mint in token_mints
+            ]
+            
+            for start in range(0, len(accounts), MAX_MULTIPLE_ACCOUNTS):
+                mints = token_mints[start:start + MAX_MULTIPLE_ACCOUNTS]
+                try:
+                    response = await self.rpc.client.get_multiple_accounts_json_parsed(
+                        accounts[start:start + MAX_MULTIPLE_ACCOUNTS]
+                    )
+                except Exception as e:
+                    # Leave this page at 0 and keep going with the next one
+                    logger.error(f"Failed to get token accounts {start}-{start + len(mints) - 1}: {str(e)}")
+                    continue
+                    
+                for mint, account in zip(mints, response.value):
+                    if account is None:
+                        continue
+                    parsed = getattr(account.data, 'parsed', None)
+                    try:
+                        balances[mint] = float(parsed['info']['tokenAmount']['amount'])
+                    except (KeyError, TypeError):
+                        logger.warning(f"Account for {mint} is not a parsed token account")
+                        
+            return balances
+            
+        except Exception as e:
+            logger.error(f"Failed to get token balances: {str(e)}")
+            return balances
+            
+    async def get_balances_batch(self, token_mints: List[str]) -> Dict[str, float]:
+        """Get SOL and SPL token balances with JSON-RPC batch requests.
+
+        getBalance and one getTokenAccountsByOwner per mint are sent as a
+        single array body, so a refresh costs one round-trip per
+        MAX_BATCH_REQUESTS calls. Returns balances keyed by 'SOL' and mint.
+        """
+        balances = {'SOL': 0.0, **{mint: 0.0 for mint in token_mints}}
+        try:
+            if not self.keypair:
+                raise Exception("Wallet not initialized")
+            if not self.rpc_url:
+                raise Exception("No RPC endpoint configured")
+                
+            owner = str(self.keypair.pubkey())
+            keys = ['SOL'] + list(token_mints)
+            calls = [{"jsonrpc": "2.0", "id": 0, "method": "getBalance", "params": [owner]}]
+            for mint in token_mints:
+                calls.append({
+                    "jsonrpc": "2.0",
+                    "id": len(calls),
+                    "method": "getTokenAccountsByOwner",
+                    "params": [owner, {"mint": mint}, {"encoding": "jsonParsed"}]
+                })
+                
+            sol_fetched = False
+            session = await self._get_session()
+            for start in range(0, len(calls), MAX_BATCH_REQUESTS):
+                payload = orjson.dumps(calls[start:start + MAX_BATCH_REQUESTS])
+                async with session.post(self.rpc_url, data=payload) as response:
+                    response.raise_for_status()
+                    results = orjson.loads(await response.read())
+                    
+                for item in results:
+                    # A failed sub-request leaves its balance at 0 without
+                    # discarding the rest of the batch
+                    result = item.get('result')
+                    if result is None:
+                        logger.warning("Batch request %s failed: %s", item.get('id'), item.get('error'))
+                        continue
+                    key = keys[item['id']]
+                    if key == 'SOL':
+                        balances['SOL'] = result['value'] / 1e9  # Convert lamports to SOL
+                        sol_fetched = True
+                    else:
+                        balances[key] = sum(
+                            float(account['account']['data']['parsed']['info']['tokenAmount']['amount'])
+                            for account in result['value']
+                        )
+                        
+            # Don't cache the 0.0 placeholder from a failed getBalance
+            if sol_fetched:
+                self._balance_cache = (balances['SOL'], time.monotonic() + self.balance_cache_ttl)
+            return balances
+            
+        except Exception as e:
+            logger.error(f"Failed to get batch balances: {str(e)}")
+            return balances
+            
     async def sign_transaction(self, transaction: Transaction) -> Transaction:
         """Sign a transaction with the wallet keypair."""
         try:
@@ -175,6 +316,8 @@ class WalletManager:
             if not response.value:
                 raise Exception("Failed to send transaction")
                 
+            # Balance is about to change, don't serve a stale value
+            self._balance_cache = None
             return response.value
             
         except Exception as e:
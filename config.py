@@ -4,24 +4,87 @@ Configuration management for CryptoBot
 
 import os
 import logging
+import functools
+import importlib.util
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Final, Optional
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('cryptobot.log')
-    ]
-)
+# Set up logging unless the host (pytest, streamlit) already configured it;
+# the log file is only opened on the first record
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler('cryptobot.log', delay=True)
+        ]
+    )
 logger = logging.getLogger(__name__)
 
+# Markets watched by the risk monitor; a tuple so callers can't mutate it
+TRADING_PAIRS: Final = ('SOL/USDT',)
+
+VALID_NETWORKS = frozenset({'mainnet-beta', 'testnet', 'devnet'})
+
+# (attribute, lower bound, upper bound, lower bound inclusive); upper bounds are inclusive
+VALIDATION_RULES = (
+    # Trading parameters
+    ('POSITION_SIZE', 0, 100, False),
+    ('STOP_LOSS_PERCENT', 0, 100, False),
+    ('TAKE_PROFIT_PERCENT', 0, 100, False),
+    # Technical analysis parameters
+    ('RSI_PERIOD', 0, 50, False),
+    ('RSI_OVERBOUGHT', 50, 100, False),
+    ('RSI_OVERSOLD', 0, 50, True),
+    # Risk parameters
+    ('MAX_DRAWDOWN', 0, 100, False),
+    ('DAILY_LOSS_LIMIT', 0, 100, False),
+)
+
 class Config:
     """Configuration class for the CryptoBot"""
     
+    # (attribute / environment variable, default, cast)
+    _FIELDS = (
+        # Network configuration
+        ('NETWORK', 'mainnet-beta', str),  # mainnet-beta, testnet, or devnet
+        
+        # RPC configuration
+        ('RPC_URL', 'https://api.mainnet-beta.solana.com', str),
+        ('RPC_TIMEOUT', 30, int),
+        
+        # Trading configuration
+        ('MAX_TRADES', 5, int),
+        ('POSITION_SIZE', 0.1, float),
+        ('STOP_LOSS_PERCENT', 2.0, float),
+        ('TAKE_PROFIT_PERCENT', 4.0, float),
+        
+        # Technical analysis parameters
+        ('RSI_PERIOD', 14, int),
+        ('RSI_OVERBOUGHT', 70.0, float),
+        ('RSI_OVERSOLD', 30.0, float),
+        ('EMA_FAST', 12, int),
+        ('EMA_SLOW', 26, int),
+        ('MACD_SIGNAL', 9, int),
+        
+        # Risk management parameters
+        ('MAX_DRAWDOWN', 10.0, float),
+        ('DAILY_LOSS_LIMIT', 5.0, float),
+        ('MAX_POSITION_SIZE', 20.0, float),
+        
+        # Solana-specific settings
+        ('COMMITMENT_LEVEL', 'confirmed', str),
+        ('TRANSACTION_TIMEOUT', 60, int),
+        ('MAX_RETRIES', 3, int),
+        ('RETRY_DELAY', 1, int),
+        
+        # Jupiter DEX settings
+        ('JUPITER_QUOTE_API', 'https://quote-api.jup.ag/v4', str),
+        ('SLIPPAGE_BPS', 50, int),  # 0.5%
+    )
+    
     def __init__(self):
         """Initialize configuration"""
         try:
@@ -29,51 +92,18 @@ class Config:
             cwd = os.getcwd()
             logger.info(f"Initializing configuration in: {cwd}")
             
-            # Load environment variables from .env file
-            env_path = Path('.env').absolute()
-            logger.info(f"Loading configuration from: {env_path}")
-            
-            if not env_path.exists():
-                raise FileNotFoundError(f"Configuration file not found at {env_path}")
-            
-            # Load the .env file
-            load_dotenv(dotenv_path=str(env_path), override=True, encoding='utf-8')
-            
-            # Network configuration
-            self.NETWORK = os.getenv('NETWORK', 'mainnet-beta')  # mainnet-beta, testnet, or devnet
-            
-            # RPC configuration
-            self.RPC_URL = os.getenv('RPC_URL', 'https://api.mainnet-beta.solana.com')
-            self.RPC_TIMEOUT = int(os.getenv('RPC_TIMEOUT', '30'))
-            
-            # Trading configuration
-            self.MAX_TRADES = int(os.getenv('MAX_TRADES', '5'))
-            self.POSITION_SIZE = float(os.getenv('POSITION_SIZE', '0.1'))
-            self.STOP_LOSS_PERCENT = float(os.getenv('STOP_LOSS_PERCENT', '2'))
-            self.TAKE_PROFIT_PERCENT = float(os.getenv('TAKE_PROFIT_PERCENT', '4'))
-            
-            # Technical analysis parameters
-            self.RSI_PERIOD = int(os.getenv('RSI_PERIOD', '14'))
-            self.RSI_OVERBOUGHT = float(os.getenv('RSI_OVERBOUGHT', '70'))
-            self.RSI_OVERSOLD = float(os.getenv('RSI_OVERSOLD', '30'))
-            self.EMA_FAST = int(os.getenv('EMA_FAST', '12'))
-            self.EMA_SLOW = int(os.getenv('EMA_SLOW', '26'))
-            self.MACD_SIGNAL = int(os.getenv('MACD_SIGNAL', '9'))
-            
-            # Risk management parameters
-            self.MAX_DRAWDOWN = float(os.getenv('MAX_DRAWDOWN', '10'))
-            self.DAILY_LOSS_LIMIT = float(os.getenv('DAILY_LOSS_LIMIT', '5'))
-            self.MAX_POSITION_SIZE = float(os.getenv('MAX_POSITION_SIZE', '20'))
-            
-            # Solana-specific settings
-            self.COMMITMENT_LEVEL = os.getenv('COMMITMENT_LEVEL', 'confirmed')
-            self.TRANSACTION_TIMEOUT = int(os.getenv('TRANSACTION_TIMEOUT', '60'))
-            self.MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-            self.RETRY_DELAY = int(os.getenv('RETRY_DELAY', '1'))
+            # Orchestrators that inject the environment directly set
+            # CRYPTOBOT_ENV_INJECTED=1 so no .env file is read
+            if os.getenv('CRYPTOBOT_ENV_INJECTED') == '1':
+                logger.info("Using injected environment, skipping .env")
+            else:
+                self._load_env_file()
             
-            # Jupiter DEX settings
-            self.JUPITER_QUOTE_API = os.getenv('JUPITER_QUOTE_API', 'https://quote-api.jup.ag/v4')
-            self.SLIPPAGE_BPS = int(os.getenv('SLIPPAGE_BPS', '50'))  # 0.5%
+            env = os.environ
+            for name, default, cast in self._FIELDS:
+                value = env.get(name)
+                setattr(self, name, cast(value) if value is not None else default)
+            self.TRADING_PAIRS = TRADING_PAIRS
             
             logger.info("Configuration loaded successfully")
             
@@ -81,40 +111,83 @@ class Config:
             logger.error(f"Error initializing configuration: {str(e)}")
             raise
     
+    def _load_env_file(self) -> None:
+        """Load .env from the working directory into the environment"""
+        env_path = Path('.env').absolute()
+        logger.info(f"Loading configuration from: {env_path}")
+        
+        if not env_path.exists():
+            raise FileNotFoundError(f"Configuration file not found at {env_path}")
+        
+        # Use the precompiled .env if it is up to date, else parse .env,
+        # leaving python-dotenv for files the simple parser can't handle
+        values = self._load_compiled_env(env_path)
+        if values is None:
+            values = self._parse_simple_env(env_path)
+        if values is not None:
+            os.environ.update(values)
+        else:
+            load_dotenv(dotenv_path=str(env_path), override=True, encoding='utf-8')
+    
+    @staticmethod
+    def _load_compiled_env(env_path: Path) -> Optional[Dict[str, str]]:
+        """Load values written by scripts/compile_env.py unless older than .env"""
+        compiled_path = env_path.with_name('_env_compiled.py')
+        try:
+            if compiled_path.stat().st_mtime < env_path.stat().st_mtime:
+                logger.info("Compiled environment is stale, parsing .env instead")
+                return None
+            spec = importlib.util.spec_from_file_location('_env_compiled', compiled_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.ENV
+        except (OSError, ImportError, AttributeError):
+            return None
+    
+    @staticmethod
+    def _parse_simple_env(env_path: Path) -> Optional[Dict[str, str]]:
+        """Parse a plain KEY=VALUE .env file, or None if it needs python-dotenv"""
+        try:
+            with open(env_path, encoding='utf-8-sig') as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None
+        
+        values = {}
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.partition('=')
+            key = key.strip()
+            # Interpolation, escapes and export prefixes are left to python-dotenv
+            if not sep or not key or ' ' in key or '${' in value or '\\' in value:
+                return None
+            value = value.strip()
+            if value[:1] in ('"', "'"):
+                quote = value[0]
+                if len(value) < 2 or not value.endswith(quote) or quote in value[1:-1]:
+                    return None
+                value = value[1:-1]
+            else:
+                # Unquoted values end at an inline comment
+                for marker in (' #', '\t#'):
+                    value = value.split(marker, 1)[0]
+                value = value.rstrip()
+            values[key] = value
+        return values
+    
     def validate(self) -> bool:
         """Validate the configuration"""
         try:
-            # Validate network
-            valid_networks = ['mainnet-beta', 'testnet', 'devnet']
-            if self.NETWORK not in valid_networks:
+            if self.NETWORK not in VALID_NETWORKS:
                 raise ValueError(f"Invalid network: {self.NETWORK}")
             
-            # Validate trading parameters
-            if not (0 < self.POSITION_SIZE <= 100):
-                raise ValueError(f"Invalid POSITION_SIZE: {self.POSITION_SIZE}")
-            
-            if not (0 < self.STOP_LOSS_PERCENT <= 100):
-                raise ValueError(f"Invalid STOP_LOSS_PERCENT: {self.STOP_LOSS_PERCENT}")
-            
-            if not (0 < self.TAKE_PROFIT_PERCENT <= 100):
-                raise ValueError(f"Invalid TAKE_PROFIT_PERCENT: {self.TAKE_PROFIT_PERCENT}")
-            
-            # Validate technical analysis parameters
-            if not (0 < self.RSI_PERIOD <= 50):
-                raise ValueError(f"Invalid RSI_PERIOD: {self.RSI_PERIOD}")
-            
-            if not (50 < self.RSI_OVERBOUGHT <= 100):
-                raise ValueError(f"Invalid RSI_OVERBOUGHT: {self.RSI_OVERBOUGHT}")
-            
-            if not (0 <= self.RSI_OVERSOLD <= 50):
-                raise ValueError(f"Invalid RSI_OVERSOLD: {self.RSI_OVERSOLD}")
-            
-            # Validate risk parameters
-            if not (0 < self.MAX_DRAWDOWN <= 100):
-                raise ValueError(f"Invalid MAX_DRAWDOWN: {self.MAX_DRAWDOWN}")
-            
-            if not (0 < self.DAILY_LOSS_LIMIT <= 100):
-                raise ValueError(f"Invalid DAILY_LOSS_LIMIT: {self.DAILY_LOSS_LIMIT}")
+            for name, low, high, low_inclusive in VALIDATION_RULES:
+                value = getattr(self, name)
+                above_low = value >= low if low_inclusive else value > low
+                if not (above_low and value <= high):
+                    raise ValueError(f"Invalid {name}: {value}")
             
             logger.info("Configuration validation successful")
             return True
@@ -123,9 +196,20 @@ class Config:
             logger.error(f"Configuration validation failed: {str(e)}")
             return False
 
-# Create global config instance
-config = Config()
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Create and validate the global config instance on first use.
+    
+    Set CRYPTOBOT_SKIP_VALIDATION=1 to skip validation in deployments
+    whose config was already validated in CI.
+    """
+    config = Config()
+    if os.getenv('CRYPTOBOT_SKIP_VALIDATION') != '1' and not config.validate():
+        raise ValueError("Configuration validation failed")
+    return config
 
-# Validate configuration
-if not config.validate():
-    raise ValueError("Configuration validation failed")
+def __getattr__(name: str) -> Any:
+    """Resolve `config` lazily so importing this module doesn't load .env"""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,21 @@
+from collections import deque
 from datetime import datetime, timedelta
 import os
+import time
 import json
 import hashlib
 import secrets
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional
 
 class SecurityManager:
     def __init__(self):
-        self.rate_limits: Dict[str, List[datetime]] = {}
+        self.rate_limits: Dict[str, Deque[float]] = {}  # monotonic request times per IP
         self.api_keys: Dict[str, dict] = {}
         self.whitelisted_ips: set = set()
         self.max_requests_per_minute = 60
         self.key_rotation_days = 30
+        self._sweep_counter = 0
+        self._sweep_interval = 1024  # requests between idle-IP sweeps
         
     def load_config(self):
         """Load security configuration from environment or config file"""
@@ -47,21 +51,31 @@ class SecurityManager:
     
     def check_rate_limit(self, ip: str) -> bool:
         """Check if IP has exceeded rate limit"""
-        now = datetime.now()
-        minute_ago = now - timedelta(minutes=1)
+        now = time.monotonic()
+        minute_ago = now - 60
         
-        # Clean old requests
-        if ip in self.rate_limits:
-            self.rate_limits[ip] = [t for t in self.rate_limits[ip] if t > minute_ago]
-        else:
-            self.rate_limits[ip] = []
+        # Drop requests older than a minute; times are appended in order
+        requests = self.rate_limits.get(ip)
+        if requests is None:
+            requests = self.rate_limits[ip] = deque()
+        while requests and requests[0] <= minute_ago:
+            requests.popleft()
         
         # Check limit
-        if len(self.rate_limits[ip]) >= self.max_requests_per_minute:
+        if len(requests) >= self.max_requests_per_minute:
             return False
         
         # Add new request
-        self.rate_limits[ip].append(now)
+        requests.append(now)
+        
+        # Periodically forget IPs with no requests in the last minute
+        self._sweep_counter += 1
+        if self._sweep_counter >= self._sweep_interval:
+            self._sweep_counter = 0
+            self.rate_limits = {
+                key: times for key, times in self.rate_limits.items()
+                if times[-1] > minute_ago
+            }
         return True
     
     def is_ip_whitelisted(self, ip: str) -> bool:
@@ -98,4 +112,5 @@ class SecurityManager:
     
     def hash_sensitive_data(self, data: str) -> str:
         """Hash sensitive data for logging"""
-        return hashlib.sha256(data.encode()).hexdigest()[:8]
+        # Short log tag only; 4-byte BLAKE2b gives the same 8 hex chars cheaper
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=4).hexdigest()
@@ -1,79 +1,105 @@
 """Configuration validation and sanity checking for CryptoBot."""
 
-from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Optional, List
+from typing import Dict, NamedTuple, Optional, List, Tuple
+import functools
 import logging
 from pathlib import Path
 import json
 import os
+import time
+import psutil
 
 logger = logging.getLogger('ConfigValidator')
 
-@dataclass
-class ValidationResult:
+# Validation passes within the same bucket reuse one resource reading
+RESOURCE_CACHE_SECONDS = 5
+
+# Risk and trading thresholds, built once instead of per validation call
+_MAX_POSITION_SIZE_LIMIT = Decimal('0.2')
+_MAX_POSITION_SIZE_RECOMMENDED = Decimal('0.1')
+_MAX_TOTAL_EXPOSURE_LIMIT = Decimal('0.8')
+_MAX_TOTAL_EXPOSURE_RECOMMENDED = Decimal('0.5')
+_MAX_DRAWDOWN_LIMIT = Decimal('0.2')
+_MAX_DRAWDOWN_RECOMMENDED = Decimal('0.1')
+_RISK_PER_TRADE_LIMIT = Decimal('0.05')
+_RISK_PER_TRADE_RECOMMENDED = Decimal('0.02')
+_MIN_WIN_RATE_RECOMMENDED = Decimal('0.4')
+_MIN_PROFIT_FACTOR_RECOMMENDED = Decimal('1.5')
+
+@functools.lru_cache(maxsize=1)
+def _system_resources(bucket: int) -> Tuple[int, int]:
+    """Available memory and home-disk free space in bytes for a time bucket."""
+    return (
+        psutil.virtual_memory().available,
+        psutil.disk_usage(os.path.expanduser("~")).free
+    )
+
+class ValidationResult(NamedTuple):
     """Result of configuration validation."""
     is_valid: bool
     errors: List[str]
     warnings: List[str]
 
 class ConfigValidator:
-    """Validates trading configuration parameters."""
+    """Validates trading configuration parameters.
+    
+    Stateless: each validate_* call returns only its own findings.
+    """
     
-    def __init__(self):
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        
     def validate_risk_params(self,
                            max_position_size: Decimal,
                            max_total_exposure: Decimal,
                            max_drawdown: Decimal,
                            risk_per_trade: Decimal) -> ValidationResult:
         """Validate risk management parameters."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        
         # Check position size limits
-        if max_position_size > Decimal('0.2'):
-            self.errors.append(
+        if max_position_size > _MAX_POSITION_SIZE_LIMIT:
+            errors.append(
                 f"Max position size {float(max_position_size):.1%} exceeds safe limit of 20%"
             )
-        elif max_position_size > Decimal('0.1'):
-            self.warnings.append(
+        elif max_position_size > _MAX_POSITION_SIZE_RECOMMENDED:
+            warnings.append(
                 f"Max position size {float(max_position_size):.1%} is higher than recommended 10%"
             )
             
         # Check total exposure
-        if max_total_exposure > Decimal('0.8'):
-            self.errors.append(
+        if max_total_exposure > _MAX_TOTAL_EXPOSURE_LIMIT:
+            errors.append(
                 f"Max total exposure {float(max_total_exposure):.1%} exceeds safe limit of 80%"
             )
-        elif max_total_exposure > Decimal('0.5'):
-            self.warnings.append(
+        elif max_total_exposure > _MAX_TOTAL_EXPOSURE_RECOMMENDED:
+            warnings.append(
                 f"Max total exposure {float(max_total_exposure):.1%} is higher than recommended 50%"
             )
             
         # Check drawdown limit
-        if max_drawdown > Decimal('0.2'):
-            self.errors.append(
+        if max_drawdown > _MAX_DRAWDOWN_LIMIT:
+            errors.append(
                 f"Max drawdown {float(max_drawdown):.1%} exceeds safe limit of 20%"
             )
-        elif max_drawdown > Decimal('0.1'):
-            self.warnings.append(
+        elif max_drawdown > _MAX_DRAWDOWN_RECOMMENDED:
+            warnings.append(
                 f"Max drawdown {float(max_drawdown):.1%} is higher than recommended 10%"
             )
             
         # Check risk per trade
-        if risk_per_trade > Decimal('0.05'):
-            self.errors.append(
+        if risk_per_trade > _RISK_PER_TRADE_LIMIT:
+            errors.append(
                 f"Risk per trade {float(risk_per_trade):.1%} exceeds safe limit of 5%"
             )
-        elif risk_per_trade > Decimal('0.02'):
-            self.warnings.append(
+        elif risk_per_trade > _RISK_PER_TRADE_RECOMMENDED:
+            warnings.append(
                 f"Risk per trade {float(risk_per_trade):.1%} is higher than recommended 2%"
             )
             
         return ValidationResult(
-            is_valid=len(self.errors) == 0,
-            errors=self.errors,
-            warnings=self.warnings
+            is_valid=not errors,
+            errors=errors,
+            warnings=warnings
         )
         
     def validate_trading_params(self,
@@ -82,92 +108,97 @@ class ConfigValidator:
                               min_win_rate: Decimal,
                               min_profit_factor: Decimal) -> ValidationResult:
         """Validate trading parameters."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        
         # Check trade interval
         if min_trade_interval < 60:
-            self.errors.append(
+            errors.append(
                 f"Minimum trade interval {min_trade_interval}s is too low, should be at least 60s"
             )
         elif min_trade_interval < 300:
-            self.warnings.append(
+            warnings.append(
                 f"Minimum trade interval {min_trade_interval}s is lower than recommended 300s"
             )
             
         # Check daily trade limit
         if max_daily_trades > 50:
-            self.errors.append(
+            errors.append(
                 f"Maximum daily trades {max_daily_trades} exceeds safe limit of 50"
             )
         elif max_daily_trades > 20:
-            self.warnings.append(
+            warnings.append(
                 f"Maximum daily trades {max_daily_trades} is higher than recommended 20"
             )
             
         # Check win rate requirement
-        if min_win_rate < Decimal('0.4'):
-            self.warnings.append(
+        if min_win_rate < _MIN_WIN_RATE_RECOMMENDED:
+            warnings.append(
                 f"Minimum win rate {float(min_win_rate):.1%} is lower than recommended 40%"
             )
             
         # Check profit factor requirement
-        if min_profit_factor < Decimal('1.5'):
-            self.warnings.append(
+        if min_profit_factor < _MIN_PROFIT_FACTOR_RECOMMENDED:
+            warnings.append(
                 f"Minimum profit factor {float(min_profit_factor):.1f} is lower than recommended 1.5"
             )
             
         return ValidationResult(
-            is_valid=len(self.errors) == 0,
-            errors=self.errors,
-            warnings=self.warnings
+            is_valid=not errors,
+            errors=errors,
+            warnings=warnings
         )
         
     def validate_path_permissions(self, paths: List[Path]) -> ValidationResult:
         """Validate file system permissions."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        
         for path in paths:
             # Check if directory exists or can be created
             if not path.exists():
                 try:
                     path.mkdir(parents=True, exist_ok=True)
                 except Exception as e:
-                    self.errors.append(f"Cannot create directory {path}: {str(e)}")
+                    errors.append(f"Cannot create directory {path}: {str(e)}")
                     continue
                     
-            # Check write permission
-            try:
-                test_file = path / '.test_write'
-                test_file.touch()
-                test_file.unlink()
-            except Exception as e:
-                self.errors.append(f"No write permission for {path}: {str(e)}")
+            # Check write permission; os.access can be wrong on NFS or with ACLs,
+            # which is acceptable for a best-effort startup check
+            if not os.access(path, os.W_OK):
+                errors.append(f"No write permission for {path}")
                 
         return ValidationResult(
-            is_valid=len(self.errors) == 0,
-            errors=self.errors,
-            warnings=self.warnings
+            is_valid=not errors,
+            errors=errors,
+            warnings=warnings
         )
         
     def validate_system_resources(self,
                                 min_memory_mb: int = 1024,
                                 min_disk_space_mb: int = 5120) -> ValidationResult:
         """Validate system resources."""
-        import psutil
+        errors: List[str] = []
+        warnings: List[str] = []
+        
+        memory_bytes, disk_bytes = _system_resources(int(time.monotonic() // RESOURCE_CACHE_SECONDS))
         
         # Check available memory
-        available_memory = psutil.virtual_memory().available / (1024 * 1024)  # Convert to MB
+        available_memory = memory_bytes / (1024 * 1024)  # Convert to MB
         if available_memory < min_memory_mb:
-            self.errors.append(
+            errors.append(
                 f"Insufficient memory: {available_memory:.0f}MB < {min_memory_mb}MB required"
             )
             
         # Check disk space
-        disk_usage = psutil.disk_usage(os.path.expanduser("~"))
-        available_space = disk_usage.free / (1024 * 1024)  # Convert to MB
+        available_space = disk_bytes / (1024 * 1024)  # Convert to MB
         if available_space < min_disk_space_mb:
-            self.errors.append(
+            errors.append(
                 f"Insufficient disk space: {available_space:.0f}MB < {min_disk_space_mb}MB required"
             )
             
         return ValidationResult(
-            is_valid=len(self.errors) == 0,
-            errors=self.errors,
-            warnings=self.warnings
+            is_valid=not errors,
+            errors=errors,
+            warnings=warnings
         )
@@ -1,5 +1,8 @@
+import heapq
+from operator import itemgetter
 import streamlit as st
 import pandas as pd
+import numpy as np
 from typing import Dict, List
 import ccxt
 from datetime import datetime, timedelta
@@ -9,10 +12,31 @@ def get_exchange():
     """Initialize and cache the exchange connection."""
     return ccxt.binance()
 
+# Module-level handle so cache misses skip the cache_resource lookup;
+# reset when Streamlit reloads this module
+_exchange = None
+
+def _get_bound_exchange():
+    """Return the cached exchange, resolving it on first use."""
+    global _exchange
+    if _exchange is None:
+        _exchange = get_exchange()
+    return _exchange
+
 @st.cache_data(ttl="5m")  # Cache for 5 minutes
 def fetch_current_prices(symbols: List[str]) -> Dict[str, float]:
     """Fetch current prices for multiple symbols."""
-    exchange = get_exchange()
+    exchange = _get_bound_exchange()
+    try:
+        # One request for all symbols instead of one per symbol
+        tickers = exchange.fetch_tickers(symbols)
+        return {
+            symbol: tickers[symbol]['last'] if symbol in tickers else None
+            for symbol in symbols
+        }
+    except Exception as e:
+        st.warning(f"Batch price fetch failed, fetching individually: {str(e)}")
+    
     prices = {}
     for symbol in symbols:
         try:
@@ -27,11 +51,18 @@ def fetch_current_prices(symbols: List[str]) -> Dict[str, float]:
 def fetch_historical_data(symbol: str, timeframe: str = '1h', limit: int = 168) -> pd.DataFrame:
     """Fetch historical OHLCV data with caching."""
     try:
-        exchange = get_exchange()
+        exchange = _get_bound_exchange()
         ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        return df
+        # Typed columns skip pandas' per-column object inference
+        arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'),
+            'open': arr[:, 1],
+            'high': arr[:, 2],
+            'low': arr[:, 3],
+            'close': arr[:, 4],
+            'volume': arr[:, 5]
+        })
     except Exception as e:
         st.error(f"Error fetching historical data: {str(e)}")
         return pd.DataFrame()
@@ -39,11 +70,15 @@ def fetch_historical_data(symbol: str, timeframe: str = '1h', limit: int = 168)
 @st.cache_data(ttl="15m")  # Cache for 15 minutes
 def get_market_overview() -> Dict:
     """Get market overview data."""
-    exchange = get_exchange()
+    exchange = _get_bound_exchange()
     try:
         tickers = exchange.fetch_tickers()
-        volumes = {k: v['quoteVolume'] for k, v in tickers.items() if v['quoteVolume']}
-        top_volume = dict(sorted(volumes.items(), key=lambda x: x[1], reverse=True)[:10])
+        # Partial top-10 selection instead of sorting every market
+        top_volume = dict(heapq.nlargest(
+            10,
+            ((k, v['quoteVolume']) for k, v in tickers.items() if v['quoteVolume']),
+            key=itemgetter(1)
+        ))
         
         return {
             'total_markets': len(tickers),
@@ -1,23 +1,63 @@
 """Base exchange interface for CryptoBot."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from decimal import Decimal
 import asyncio
 from datetime import datetime
 import logging
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+import numpy as np
 
 logger = logging.getLogger('Exchange')
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _book_levels(levels: Sequence[Sequence[Any]]) -> np.ndarray:
+    """Order book (price, amount) levels as a float64 array of shape (n, 2)."""
+    return np.array(levels, dtype=np.float64).reshape(-1, 2)
+
+def _decimal_levels(levels: Sequence[Sequence[Any]]) -> List[tuple[Decimal, Decimal]]:
+    """Order book (price, amount) levels as exact Decimal tuples."""
+    return [(Decimal(price), Decimal(amount)) for price, amount in levels]
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OrderBook:
-    """Order book data structure."""
-    bids: List[tuple[Decimal, Decimal]]  # price, amount
-    asks: List[tuple[Decimal, Decimal]]  # price, amount
+    """Order book data structure.
+    
+    bid_levels/ask_levels are the (price, amount) levels as Decimals or the
+    exchange's numeric strings. Analytics use the float64 arrays parsed from
+    them once; the exact Decimal bids/asks are only built on first access.
+    """
+    bid_levels: Sequence[Sequence[Any]] = field(repr=False)
+    ask_levels: Sequence[Sequence[Any]] = field(repr=False)
     timestamp: datetime
+    bids_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    asks_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _bids: Optional[List[tuple[Decimal, Decimal]]] = field(default=None, init=False, repr=False, compare=False)
+    _asks: Optional[List[tuple[Decimal, Decimal]]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.bids_arr = _book_levels(self.bid_levels)
+        self.asks_arr = _book_levels(self.ask_levels)
+        
+    @property
+    def bids(self) -> List[tuple[Decimal, Decimal]]:
+        """Bid (price, amount) levels as Decimals."""
+        if self._bids is None:
+            self._bids = _decimal_levels(self.bid_levels)
+        return self._bids
+        
+    @property
+    def asks(self) -> List[tuple[Decimal, Decimal]]:
+        """Ask (price, amount) levels as Decimals."""
+        if self._asks is None:
+            self._asks = _decimal_levels(self.ask_levels)
+        return self._asks
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Trade:
     """Trade data structure."""
     id: str
@@ -29,7 +69,7 @@ class Trade:
     fee: Optional[Decimal] = None
     fee_currency: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Position:
     """Position data structure."""
     symbol: str
@@ -131,23 +171,40 @@ class ExchangeInterface(ABC):
                               side: str,
                               amount: Decimal) -> Decimal:
         """Calculate market impact for a potential trade."""
-        orderbook = await self.get_orderbook(symbol)
-        orders = orderbook.bids if side == 'sell' else orderbook.asks
+        impact = (await self.get_market_impact_curve(symbol, side, [amount]))[0]
+        if np.isinf(impact):
+            return Decimal('inf')  # Not enough liquidity
+        return Decimal(str(impact))
         
-        remaining = amount
-        weighted_price = Decimal('0')
+    async def get_market_impact_curve(self,
+                                    symbol: str,
+                                    side: str,
+                                    amounts: Sequence[Decimal]) -> np.ndarray:
+        """Calculate market impact for several trade sizes from one order book.
         
-        for price, size in orders:
-            if remaining <= 0:
-                break
-            filled = min(remaining, size)
-            weighted_price += price * filled
-            remaining -= filled
-            
-        if remaining > 0:
-            return Decimal('inf')  # Not enough liquidity
+        Returns the relative impact per amount, inf where liquidity runs out.
+        """
+        orderbook = await self.get_orderbook(symbol)
+        levels = orderbook.bids_arr if side == 'sell' else orderbook.asks_arr
+        prices, sizes = levels[:, 0], levels[:, 1]
+        targets = np.asarray(amounts, dtype=np.float64)
+        impacts = np.full(targets.shape, np.inf)
+        if not prices.size:
+            return impacts
             
-        return abs(weighted_price / amount - orders[0][0]) / orders[0][0]
+        cumulative_size = np.cumsum(sizes)
+        cumulative_cost = np.cumsum(prices * sizes)
+        
+        # Levels before the fill level are consumed whole, the last one partially
+        last = np.searchsorted(cumulative_size, targets)
+        fillable = last < cumulative_size.size
+        last, targets = last[fillable], targets[fillable]
+        size_before = np.where(last > 0, cumulative_size[last - 1], 0.0)
+        cost_before = np.where(last > 0, cumulative_cost[last - 1], 0.0)
+        cost = cost_before + prices[last] * (targets - size_before)
+        
+        impacts[fillable] = np.abs(cost / targets - prices[0]) / prices[0]
+        return impacts
         
     async def get_funding_info(self, symbol: str) -> Dict[str, Decimal]:
         """Get funding rate information for perpetual contracts."""
@@ -10,7 +10,7 @@ import hashlib
 import time
 import aiohttp
 from urllib.parse import urlencode
-import json
+import orjson
 
 from .base import (
     ExchangeInterface,
@@ -21,6 +21,9 @@ from .base import (
 
 logger = logging.getLogger('BinanceExchange')
 
+# Spot balances are valued against this asset
+QUOTE_ASSET = 'USDT'
+
 class BinanceExchange(ExchangeInterface):
     """Binance exchange implementation."""
     
@@ -30,6 +33,11 @@ class BinanceExchange(ExchangeInterface):
         
         self.api_key = config['api_key']
         self.api_secret = config['api_secret']
+        # The secret never changes, so key the HMAC once and copy it per request
+        self._hmac_template = hmac.new(
+            self.api_secret.encode('utf-8'),
+            digestmod=hashlib.sha256
+        )
         self.testnet = config.get('testnet', False)
         
         # API URLs
@@ -41,14 +49,19 @@ class BinanceExchange(ExchangeInterface):
         
         self.session = aiohttp.ClientSession()
         
+        # (fetched at, payload) of the last /v3/account response
+        self._account_cache = (0.0, None)
+        self._account_lock = asyncio.Lock()
+        
+        # Listed symbols, loaded from exchangeInfo on first use
+        self._market_symbols: Optional[set] = None
+        
     def _generate_signature(self, params: Dict) -> str:
         """Generate signature for authenticated requests."""
         query_string = urlencode(params)
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        signature = self._hmac_template.copy()
+        signature.update(query_string.encode('utf-8'))
+        return signature.hexdigest()
         
     async def _public_request(self,
                             method: str,
@@ -69,7 +82,7 @@ class BinanceExchange(ExchangeInterface):
                     return await self._public_request(method, path, params)
                     
                 response.raise_for_status()
-                return await response.json()
+                return orjson.loads(await response.read())
                 
         except aiohttp.ClientError as e:
             logger.error(f"API request failed: {e}")
@@ -100,28 +113,50 @@ class BinanceExchange(ExchangeInterface):
                     return await self._private_request(method, path, params)
                     
                 response.raise_for_status()
-                return await response.json()
+                return orjson.loads(await response.read())
                 
         except aiohttp.ClientError as e:
             logger.error(f"API request failed: {e}")
             raise
             
+    async def _get_account(self, max_age: float = 1.0) -> Dict:
+        """Get account info, reusing a response younger than max_age seconds."""
+        # Concurrent callers wait on the lock and share one signed request
+        async with self._account_lock:
+            fetched_at, account = self._account_cache
+            if account is None or time.monotonic() - fetched_at >= max_age:
+                account = await self._private_request('GET', '/v3/account')
+                self._account_cache = (time.monotonic(), account)
+            return account
+            
+    async def _get_market_symbols(self) -> set:
+        """Get the set of listed symbols, fetching exchangeInfo only once."""
+        if self._market_symbols is None:
+            self._market_symbols = set(await self.get_markets())
+        return self._market_symbols
+        
     async def get_markets(self) -> Dict[str, Dict]:
         """Get available markets and their properties."""
-        response = await self._public_request('GET', '/v3/exchangeInfo')
+        # permissionSets is the bulk of the payload and is never read here
+        response = await self._public_request(
+            'GET',
+            '/v3/exchangeInfo',
+            {'showPermissionSets': 'false'}
+        )
         
         markets = {}
         for symbol in response['symbols']:
+            price_filter, lot_size = symbol['filters'][:2]
             markets[symbol['symbol']] = {
                 'base': symbol['baseAsset'],
                 'quote': symbol['quoteAsset'],
                 'status': symbol['status'],
-                'min_price': Decimal(symbol['filters'][0]['minPrice']),
-                'max_price': Decimal(symbol['filters'][0]['maxPrice']),
-                'tick_size': Decimal(symbol['filters'][0]['tickSize']),
-                'min_qty': Decimal(symbol['filters'][1]['minQty']),
-                'max_qty': Decimal(symbol['filters'][1]['maxQty']),
-                'step_size': Decimal(symbol['filters'][1]['stepSize'])
+                'min_price': Decimal(price_filter['minPrice']),
+                'max_price': Decimal(price_filter['maxPrice']),
+                'tick_size': Decimal(price_filter['tickSize']),
+                'min_qty': Decimal(lot_size['minQty']),
+                'max_qty': Decimal(lot_size['maxQty']),
+                'step_size': Decimal(lot_size['stepSize'])
             }
         return markets
         
@@ -153,15 +188,11 @@ class BinanceExchange(ExchangeInterface):
             }
         )
         
+        # Levels stay as the exchange's strings; OrderBook parses them into
+        # arrays and only builds Decimals if bids/asks are read
         return OrderBook(
-            bids=[
-                (Decimal(price), Decimal(amount))
-                for price, amount in response['bids']
-            ],
-            asks=[
-                (Decimal(price), Decimal(amount))
-                for price, amount in response['asks']
-            ],
+            bid_levels=response['bids'],
+            ask_levels=response['asks'],
             timestamp=datetime.fromtimestamp(response['lastUpdateId'] / 1000)
         )
         
@@ -247,6 +278,8 @@ class BinanceExchange(ExchangeInterface):
             params['timeInForce'] = 'GTC'
             
         response = await self._private_request('POST', '/v3/order', params)
+        # Fills change balances, so the cached account is stale
+        self._account_cache = (0.0, None)
         
         return {
             'id': str(response['orderId']),
@@ -270,6 +303,7 @@ class BinanceExchange(ExchangeInterface):
                     'orderId': order_id
                 }
             )
+            self._account_cache = (0.0, None)
             return True
         except Exception as e:
             logger.error(f"Failed to cancel order: {e}")
@@ -323,29 +357,63 @@ class BinanceExchange(ExchangeInterface):
         
     async def get_positions(self) -> List[Position]:
         """Get current positions."""
-        response = await self._private_request('GET', '/v3/account')
+        response = await self._get_account()
         
-        positions = []
+        # For spot trading, we consider non-zero balances as positions
+        holdings = {}
         for balance in response['balances']:
             amount = Decimal(balance['free']) + Decimal(balance['locked'])
             if amount > 0:
-                # For spot trading, we consider non-zero balances as positions
-                ticker = await self.get_ticker(f"{balance['asset']}USDT")
-                positions.append(
-                    Position(
-                        symbol=balance['asset'],
-                        side='long',
-                        amount=amount,
-                        entry_price=Decimal('0'),  # Not applicable for spot
-                        current_price=ticker['last'],
-                        unrealized_pnl=Decimal('0')  # Not applicable for spot
-                    )
+                holdings[balance['asset']] = amount
+                
+        if not holdings:
+            return []
+            
+        # One ticker request for all held assets instead of one per asset.
+        # An unknown symbol fails the whole batch, so only listed pairs go in.
+        pairs = [f"{asset}{QUOTE_ASSET}" for asset in holdings if asset != QUOTE_ASSET]
+        symbols = []
+        if pairs:
+            listed = await self._get_market_symbols()
+            symbols = [symbol for symbol in pairs if symbol in listed]
+            
+        last_prices = {}
+        if symbols:
+            tickers = await self._public_request(
+                'GET',
+                '/v3/ticker/24hr',
+                {'symbols': orjson.dumps(symbols).decode()}
+            )
+            last_prices = {
+                ticker['symbol']: Decimal(ticker['lastPrice'])
+                for ticker in tickers
+            }
+            
+        positions = []
+        for asset, amount in holdings.items():
+            if asset == QUOTE_ASSET:
+                current_price = Decimal('1')
+            else:
+                current_price = last_prices.get(f"{asset}{QUOTE_ASSET}")
+                if current_price is None:
+                    logger.warning(f"No {QUOTE_ASSET} market for {asset}, skipping position")
+                    continue
+                    
+            positions.append(
+                Position(
+                    symbol=asset,
+                    side='long',
+                    amount=amount,
+                    entry_price=Decimal('0'),  # Not applicable for spot
+                    current_price=current_price,
+                    unrealized_pnl=Decimal('0')  # Not applicable for spot
                 )
+            )
         return positions
         
     async def get_balance(self, currency: Optional[str] = None) -> Dict[str, Decimal]:
         """Get account balance."""
-        response = await self._private_request('GET', '/v3/account')
+        response = await self._get_account()
         
         balances = {}
         for balance in response['balances']:
@@ -30,12 +30,24 @@ class JupiterDEX:
         self.config = config
         self.api_url = 'https://quote-api.jup.ag/v4'
         self.client = AsyncClient(config.get('rpc_url', 'https://api.mainnet-beta.solana.com'))
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared API session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
         
     async def get_token_list(self) -> List[Dict]:
         """Get list of supported tokens."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.api_url}/tokens") as response:
-                return await response.json()
+        session = await self._get_session()
+        async with session.get(f"{self.api_url}/tokens") as response:
+            return await response.json()
                 
     async def get_price(self,
                        input_mint: str,
@@ -51,23 +63,23 @@ class JupiterDEX:
                 'slippageBps': slippage_bps
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}/quote",
-                    params=params
-                ) as response:
-                    data = await response.json()
+            session = await self._get_session()
+            async with session.get(
+                f"{self.api_url}/quote",
+                params=params
+            ) as response:
+                data = await response.json()
+                
+                if 'data' not in data:
+                    return None
                     
-                    if 'data' not in data:
-                        return None
-                        
-                    return Route(
-                        in_amount=int(data['data']['inAmount']),
-                        out_amount=int(data['data']['outAmount']),
-                        price_impact_pct=float(data['data']['priceImpactPct']),
-                        market_infos=data['data']['marketInfos'],
-                        slippage_bps=slippage_bps
-                    )
+                return Route(
+                    in_amount=int(data['data']['inAmount']),
+                    out_amount=int(data['data']['outAmount']),
+                    price_impact_pct=float(data['data']['priceImpactPct']),
+                    market_infos=data['data']['marketInfos'],
+                    slippage_bps=slippage_bps
+                )
                     
         except Exception as e:
             logger.error(f"Failed to get price: {e}")
@@ -84,20 +96,20 @@ class JupiterDEX:
                 'wrapUnwrapSOL': True
             }
             
-            async with aiohttp.ClientSession() as session:
-                # Get serialized transaction
-                async with session.post(
-                    f"{self.api_url}/swap",
-                    json=transaction_data
-                ) as response:
-                    data = await response.json()
+            session = await self._get_session()
+            # Get serialized transaction
+            async with session.post(
+                f"{self.api_url}/swap",
+                json=transaction_data
+            ) as response:
+                data = await response.json()
+                
+                if 'swapTransaction' not in data:
+                    return None
                     
-                    if 'swapTransaction' not in data:
-                        return None
-                        
-                    # Deserialize transaction
-                    serialized_tx = base58.b58decode(data['swapTransaction'])
-                    return Transaction.deserialize(serialized_tx)
+                # Deserialize transaction
+                serialized_tx = base58.b58decode(data['swapTransaction'])
+                return Transaction.deserialize(serialized_tx)
                     
         except Exception as e:
             logger.error(f"Failed to get swap transaction: {e}")
@@ -158,4 +170,7 @@ class JupiterDEX:
         
     async def close(self):
         """Close DEX connection."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
         await self.client.close()
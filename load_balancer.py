@@ -29,7 +29,8 @@ class LoadBalancer:
                  endpoints: List[str],
                  check_interval: int = 60,
                  max_retries: int = 3,
-                 timeout: float = 10.0):
+                 timeout: float = 10.0,
+                 health_check_timeout: float = 2.0):
         """Initialize load balancer."""
         self.endpoints = {
             url: Endpoint(url=url)
@@ -39,6 +40,10 @@ class LoadBalancer:
         self.max_retries = max_retries
         self.timeout = timeout
         
+        # Health checks run concurrently; a short per-check timeout keeps one
+        # slow endpoint from holding up the whole sweep
+        self.health_check_timeout = aiohttp.ClientTimeout(total=health_check_timeout)
+        
         # Session pool
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=timeout)
@@ -85,7 +90,7 @@ class LoadBalancer:
             start_time = datetime.now()
             async with self.session.get(
                 f"{endpoint.url}/health",
-                timeout=self.timeout
+                timeout=self.health_check_timeout
             ) as response:
                 latency = (datetime.now() - start_time).total_seconds() * 1000
                 
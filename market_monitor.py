@@ -6,7 +6,6 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 import aiohttp
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +31,22 @@ class MarketMonitor:
             'X-API-KEY': birdeye_api_key,
             'Accept': 'application/json'
         }
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.session
+        
+    async def close_session(self):
+        """Close the shared HTTP session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
         
     async def get_token_metadata(self, token_address: str) -> Dict[str, Any]:
         """Fetch token metadata from Birdeye API.
@@ -43,35 +58,34 @@ class MarketMonitor:
             Dict containing token metadata or empty dict on error
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.BIRDEYE_API}/token_metadata/{token_address}"
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info("Successfully fetched token metadata for %s", token_address)
-                        return data
-                    logger.error("Failed to fetch token metadata: %s", await response.text())
-                    return {}
+            session = await self._get_session()
+            url = f"{self.BIRDEYE_API}/token_metadata/{token_address}"
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    logger.info("Successfully fetched token metadata for %s", token_address)
+                    return data
+                logger.error("Failed to fetch token metadata: %s", await response.text())
+                return {}
         except Exception as e:
             logger.error("Error fetching token metadata: %s", str(e))
             return {}
 
-    def fetch_market_data(self) -> Dict[str, Any]:
+    async def fetch_market_data(self) -> Dict[str, Any]:
         """Fetch market data from DexScreener API.
         
         Returns:
             Dict containing market data or empty dict on error
         """
         try:
-            response = requests.get(
-                f"{self.DEXSCREENER_API}/pairs/solana/{self.pair_address}",
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
+            session = await self._get_session()
+            url = f"{self.DEXSCREENER_API}/pairs/solana/{self.pair_address}"
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
             logger.info("Successfully fetched market data for pair %s", self.pair_address)
-            return response.json()
-        except requests.RequestException as e:
+            return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error("Failed to fetch market data: %s", str(e))
             return {}
 
@@ -86,16 +100,16 @@ class MarketMonitor:
             Dict containing price impact data or empty dict on error
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.BIRDEYE_API}/price_impact/{token_address}"
-                params = {'amount': str(amount_usd)}
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info("Successfully calculated price impact for %s", token_address)
-                        return data
-                    logger.error("Failed to get price impact: %s", await response.text())
-                    return {}
+            session = await self._get_session()
+            url = f"{self.BIRDEYE_API}/price_impact/{token_address}"
+            params = {'amount': str(amount_usd)}
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    logger.info("Successfully calculated price impact for %s", token_address)
+                    return data
+                logger.error("Failed to get price impact: %s", await response.text())
+                return {}
         except Exception as e:
             logger.error("Error calculating price impact: %s", str(e))
             return {}
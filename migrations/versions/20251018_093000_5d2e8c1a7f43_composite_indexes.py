@@ -0,0 +1,41 @@
+"""composite indexes for symbol/time and status lookups
+
+Revision ID: 5d2e8c1a7f43
+Revises: fc69e4bf5ba4
+Create Date: 2025-10-18 09:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8c1a7f43'
+down_revision: Union[str, None] = 'fc69e4bf5ba4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-symbol queries ordered by time become index range scans
+    op.create_index('ix_trades_symbol_ts', 'trades', ['symbol', sa.text('timestamp DESC')])
+    op.create_index('ix_risk_symbol_ts', 'risk_metrics', ['symbol', sa.text('timestamp DESC')])
+    # Open/closed position lookups, optionally narrowed by symbol
+    op.create_index('ix_positions_status_symbol', 'positions', ['status', 'symbol'])
+
+    # The composite indexes lead with these columns, so the single-column ones are redundant
+    op.drop_index('ix_trades_symbol', table_name='trades')
+    op.drop_index('ix_risk_metrics_symbol', table_name='risk_metrics')
+    op.drop_index('ix_positions_status', table_name='positions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_positions_status', 'positions', ['status'])
+    op.create_index('ix_risk_metrics_symbol', 'risk_metrics', ['symbol'])
+    op.create_index('ix_trades_symbol', 'trades', ['symbol'])
+
+    op.drop_index('ix_positions_status_symbol', table_name='positions')
+    op.drop_index('ix_risk_symbol_ts', table_name='risk_metrics')
+    op.drop_index('ix_trades_symbol_ts', table_name='trades')
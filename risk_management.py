@@ -264,12 +264,23 @@ class RiskManager:
         
         return Decimal(str(winning_trades)) / Decimal(str(len(closed_trades)))
         
+    def _pnl_totals(self) -> Tuple[Decimal, int, Decimal, int]:
+        """Gross profit, win count, gross loss and loss count in one pass."""
+        gross_profit = gross_loss = 0
+        wins = losses = 0
+        for trade in self._historical_trades:
+            pnl = trade['pnl']
+            if pnl > 0:
+                gross_profit += pnl
+                wins += 1
+            elif pnl < 0:
+                gross_loss -= pnl
+                losses += 1
+        return gross_profit, wins, gross_loss, losses
+        
     def calculate_profit_factor(self) -> Optional[Decimal]:
         """Calculate profit factor (gross profit / gross loss)."""
-        gross_profit = sum(trade['pnl'] for trade in self._historical_trades 
-                         if trade['pnl'] > 0)
-        gross_loss = sum(abs(trade['pnl']) for trade in self._historical_trades 
-                        if trade['pnl'] < 0)
+        gross_profit, _, gross_loss, _ = self._pnl_totals()
         
         if gross_loss == 0:
             return None
@@ -278,16 +289,13 @@ class RiskManager:
         
     def calculate_avg_win_loss_ratio(self) -> Optional[Decimal]:
         """Calculate average win/loss ratio."""
-        wins = [trade['pnl'] for trade in self._historical_trades 
-               if trade['pnl'] > 0]
-        losses = [abs(trade['pnl']) for trade in self._historical_trades 
-                 if trade['pnl'] < 0]
+        gross_profit, wins, gross_loss, losses = self._pnl_totals()
         
         if not wins or not losses:
             return None
             
-        avg_win = sum(wins) / len(wins)
-        avg_loss = sum(losses) / len(losses)
+        avg_win = gross_profit / wins
+        avg_loss = gross_loss / losses
         
         if avg_loss == 0:
             return None
@@ -17,6 +17,16 @@ from bot import CryptoBot  # Add this import
 
 logger = get_logger('RiskMonitor')
 
+# Annualization factor for daily statistics, computed once
+SQRT_252 = np.sqrt(252)
+
+def _sorted_percentile(sorted_values: np.ndarray, q: float) -> float:
+    """np.percentile with linear interpolation for already sorted values"""
+    position = (sorted_values.size - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, sorted_values.size - 1)
+    return float(sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low))
+
 @dataclass
 class RiskMetrics:
     """Data class for risk metrics"""
@@ -41,6 +51,7 @@ class RiskMonitorNew:
             self.exchange = bot.exchange  # Use the bot's exchange instance
             self._risk_metrics_cache: Dict[str, RiskMetrics] = {}
             self._last_update: Dict[str, datetime] = {}
+            self._risk_metrics_keys: Dict[str, Tuple] = {}  # input fingerprint per cached symbol
             self._cache_duration = 300  # 5 minutes
             self._cache_lock = Lock()
             self._metrics_calculation_lock = Lock()
@@ -82,18 +93,19 @@ class RiskMonitorNew:
             # Sharpe Ratio (assuming 0% risk-free rate for simplicity)
             returns_mean = float(np.mean(returns))
             returns_std = float(np.std(returns))
-            sharpe = float(np.sqrt(252) * (returns_mean / returns_std)) if returns_std > 0 else 0
+            sharpe = float(SQRT_252 * (returns_mean / returns_std)) if returns_std > 0 else 0
             
             # Calculate rolling mean for sharpe change
             rolling_returns = pd.Series(returns).rolling(window=20)
             rolling_means = rolling_returns.mean()
             rolling_stds = rolling_returns.std()
-            rolling_sharpes = np.sqrt(252) * (rolling_means / rolling_stds)
+            rolling_sharpes = SQRT_252 * (rolling_means / rolling_stds)
             sharpe_change = float(rolling_sharpes.diff().iloc[-1]) if not rolling_sharpes.empty else 0
             
             # Maximum Drawdown
             cumulative_returns = (1 + pd.Series(returns)).cumprod()
-            rolling_max = cumulative_returns.expanding().max()
+            # Running peak in one ufunc scan; fmax skips NaN like expanding().max()
+            rolling_max = np.fmax.accumulate(cumulative_returns.to_numpy())
             drawdowns = (cumulative_returns - rolling_max) / rolling_max
             max_drawdown = float(drawdowns.min() * 100)  # Convert to percentage
             drawdown_change = float(drawdowns.diff().iloc[-1] * 100) if not drawdowns.empty else 0
@@ -124,29 +136,41 @@ class RiskMonitorNew:
             if df is None or df.empty:
                 return None
 
+            # Reuse the cached result while the candles are unchanged
+            cache_key = (len(df), df['timestamp'].iloc[-1], float(df['close'].iloc[-1]))
+            cached = self._risk_metrics_cache.get(symbol)
+            if (cached is not None
+                    and self._risk_metrics_keys.get(symbol) == cache_key
+                    and datetime.now() - self._last_update[symbol] < timedelta(seconds=self._cache_duration)):
+                return cached
+
             # Calculate returns
             df['returns'] = df['close'].pct_change()
             df = df.dropna()
 
             # Calculate Value at Risk (VaR)
             returns = df['returns'].values
-            var = np.percentile(returns, 5)  # 95% VaR
-            var_prev = np.percentile(returns[:-1], 5)
+            # Sort once; the previous window is the same values minus the newest return
+            sorted_returns = np.sort(returns)
+            var = _sorted_percentile(sorted_returns, 5)  # 95% VaR
+            prev_sorted = np.delete(sorted_returns, np.searchsorted(sorted_returns, returns[-1]))
+            var_prev = _sorted_percentile(prev_sorted, 5)
             var_change = ((var - var_prev) / abs(var_prev)) * 100 if var_prev != 0 else 0
 
             # Calculate Sharpe Ratio
             risk_free_rate = 0.02  # 2% annual risk-free rate
             excess_returns = returns - (risk_free_rate / 252)  # Daily risk-free rate
-            sharpe = np.sqrt(252) * (excess_returns.mean() / excess_returns.std())
+            sharpe = SQRT_252 * (excess_returns.mean() / excess_returns.std())
             
             # Calculate previous Sharpe for change
             excess_returns_prev = returns[:-1] - (risk_free_rate / 252)
-            sharpe_prev = np.sqrt(252) * (excess_returns_prev.mean() / excess_returns_prev.std())
+            sharpe_prev = SQRT_252 * (excess_returns_prev.mean() / excess_returns_prev.std())
             sharpe_change = sharpe - sharpe_prev
 
             # Calculate Maximum Drawdown
             cumulative_returns = (1 + df['returns']).cumprod()
-            rolling_max = cumulative_returns.expanding().max()
+            # Running peak in one ufunc scan; fmax skips NaN like expanding().max()
+            rolling_max = np.fmax.accumulate(cumulative_returns.to_numpy())
             drawdowns = (cumulative_returns - rolling_max) / rolling_max
             max_drawdown = drawdowns.min() * 100
             
@@ -156,7 +180,7 @@ class RiskMonitorNew:
             drawdown_change = max_drawdown - max_drawdown_prev
 
             # Calculate current volatility
-            volatility = returns.std() * np.sqrt(252) * 100
+            volatility = returns.std() * SQRT_252 * 100
 
             # Calculate market beta
             market_returns = self._get_market_returns()  # Implement this method
@@ -167,7 +191,7 @@ class RiskMonitorNew:
             else:
                 beta = 1
 
-            return RiskMetrics(
+            metrics = RiskMetrics(
                 symbol=symbol,
                 var=var * 100,  # Convert to percentage
                 sharpe=sharpe,
@@ -181,6 +205,11 @@ class RiskMonitorNew:
                 timestamp=datetime.now()
             )
 
+            self._risk_metrics_cache[symbol] = metrics
+            self._risk_metrics_keys[symbol] = cache_key
+            self._last_update[symbol] = metrics.timestamp
+            return metrics
+
         except Exception as e:
             logger.error(f"Error calculating risk metrics for {symbol}: {str(e)}")
             return None
@@ -275,6 +304,7 @@ class RiskMonitorNew:
         """Cleanup resources"""
         try:
             self._risk_metrics_cache.clear()
+            self._risk_metrics_keys.clear()
             self._last_update.clear()
             self._historical_data.clear()
             logger.info("RiskMonitor resources cleaned up")
@@ -306,17 +336,17 @@ class RiskMonitor:
             
             # Calculate volatility
             returns = df['close'].pct_change()
-            volatility = returns.std() * np.sqrt(252)  # Annualized volatility
+            volatility = returns.std() * SQRT_252  # Annualized volatility
             
             # Calculate drawdown
-            rolling_max = df['close'].expanding().max()
+            rolling_max = np.fmax.accumulate(df['close'].to_numpy())
             drawdown = (df['close'] - rolling_max) / rolling_max * 100
             max_drawdown = abs(drawdown.min())
             
             # Calculate Sharpe ratio (assuming risk-free rate of 2%)
             risk_free_rate = 0.02
             excess_returns = returns - risk_free_rate/252
-            sharpe_ratio = np.sqrt(252) * excess_returns.mean() / excess_returns.std()
+            sharpe_ratio = SQRT_252 * excess_returns.mean() / excess_returns.std()
             
             # Calculate Value at Risk (VaR)
             var_95 = np.percentile(returns, 5)
@@ -0,0 +1,33 @@
+"""
+Compile .env into a Python module so Config can skip dotenv parsing.
+
+Run again whenever .env changes; Config falls back to parsing .env
+when the compiled module is missing or older than .env.
+"""
+import sys
+from pathlib import Path
+from pprint import pformat
+from dotenv import dotenv_values
+
+def compile_env(env_path: Path = Path(".env")) -> Path:
+    """Write the values from env_path to _env_compiled.py next to it."""
+    values = {
+        key: value
+        for key, value in dotenv_values(env_path, encoding="utf-8").items()
+        if value is not None
+    }
+
+    output_path = env_path.with_name("_env_compiled.py")
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write('"""Generated by scripts/compile_env.py from .env - do not edit or commit."""\n\n')
+        f.write(f"ENV = {pformat(values)}\n")
+
+    return output_path
+
+if __name__ == "__main__":
+    env_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(".env")
+    if not env_path.exists():
+        print(f"Environment file not found: {env_path}")
+        sys.exit(1)
+
+    print(f"Compiled {env_path} to {compile_env(env_path)}")
@@ -34,8 +34,10 @@ class SecurityManager:
         """Initialize security manager."""
         self.jwt_secret = jwt_secret or secrets.token_hex(32)
         self._redis_pool = None
+        self.redis: Optional[redis.Redis] = None
         if redis_url:
             self._redis_pool = ConnectionPool.from_url(redis_url)
+            self.redis = redis.Redis(connection_pool=self._redis_pool)
             
         # Metrics
         self.blocked_requests = Counter(
@@ -52,13 +54,6 @@ class SecurityManager:
         # API key storage
         self.api_keys: Dict[str, ApiKey] = {}
         
-    @property
-    def redis(self) -> Optional[redis.Redis]:
-        """Get Redis connection from pool."""
-        if self._redis_pool:
-            return redis.Redis(connection_pool=self._redis_pool)
-        return None
-        
     def load_ip_whitelist(self, filename: str = 'ip_whitelist.txt') -> None:
         """Load IP whitelist from file."""
         # Always allow localhost for both IPv4 and IPv6
@@ -144,13 +139,14 @@ class SecurityManager:
         
     def check_rate_limit(self, key_id: str) -> bool:
         """Check if request is within rate limit."""
-        if not self.redis or key_id not in self.api_keys:
+        client = self.redis
+        if not client or key_id not in self.api_keys:
             return True
             
         api_key = self.api_keys[key_id]
         redis_key = f"rate_limit:{key_id}"
         
-        pipe = self.redis.pipeline()
+        pipe = client.pipeline()
         now = int(time.time())
         pipe.zadd(redis_key, {str(now): now})
         pipe.zremrangebyscore(redis_key, 0, now - 60)  # Remove older than 1 minute
@@ -63,6 +63,7 @@ class ServiceRegistry:
                  cleanup_interval: int = 60):
         """Initialize service registry."""
         self.redis_pool = ConnectionPool.from_url(redis_url)
+        self.redis = redis.Redis(connection_pool=self.redis_pool)
         self.heartbeat_interval = heartbeat_interval
         self.cleanup_interval = cleanup_interval
         
@@ -94,11 +95,6 @@ class ServiceRegistry:
         # Start background tasks
         asyncio.create_task(self._cleanup_loop())
         
-    @property
-    def redis(self) -> redis.Redis:
-        """Get Redis connection from pool."""
-        return redis.Redis(connection_pool=self.redis_pool)
-        
     async def register(self,
                       name: str,
                       host: str,
@@ -237,6 +233,7 @@ class ServiceRegistry:
     async def close(self):
         """Clean up resources."""
         self.redis.close()
+        self.redis_pool.disconnect()
         
 # Example usage:
 # registry = ServiceRegistry('redis://localhost:6379/0')
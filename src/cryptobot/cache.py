@@ -1,10 +1,15 @@
-import pickle
-from typing import Any, Optional
-from datetime import datetime, timedelta
+import asyncio
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+# Marks a cache miss so cached functions can store None as a result
+_MISSING = object()
 
 class SimpleCache:
     _instance = None
     _cache = {}
+    max_entries = 10000
     
     def __new__(cls):
         if cls._instance is None:
@@ -15,26 +20,80 @@ class SimpleCache:
         """Set a value in the cache with optional TTL in seconds"""
         expiry = None
         if ttl is not None:
-            expiry = datetime.now() + timedelta(seconds=ttl)
+            expiry = time.monotonic() + ttl
+        # Re-insert so dict order tracks insertion age for eviction
+        self._cache.pop(key, None)
         self._cache[key] = (value, expiry)
+        if len(self._cache) > self.max_entries:
+            self._evict()
+    
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones, down to 90% of capacity"""
+        now = time.monotonic()
+        expired = [
+            key for key, (_, expiry) in self._cache.items()
+            if expiry is not None and now > expiry
+        ]
+        for key in expired:
+            del self._cache[key]
         
-    def get(self, key: str) -> Optional[Any]:
-        """Get a value from the cache, returns None if expired or not found"""
-        if key not in self._cache:
-            return None
-            
-        value, expiry = self._cache[key]
-        if expiry is not None and datetime.now() > expiry:
+        target = int(self.max_entries * 0.9)
+        while len(self._cache) > target:
+            del self._cache[next(iter(self._cache))]
+    
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        """Get a value from the cache, returns default if expired or not found"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return default
+        
+        value, expiry = entry
+        if expiry is not None and time.monotonic() > expiry:
             del self._cache[key]
-            return None
-            
-        return value
+            return default
         
+        return value
+    
     def delete(self, key: str) -> None:
         """Delete a key from the cache"""
-        if key in self._cache:
-            del self._cache[key]
-            
+        self._cache.pop(key, None)
+    
     def clear(self) -> None:
         """Clear all items from the cache"""
         self._cache.clear()
+    
+    def cached(self, ttl: Optional[int] = None, prefix: Optional[str] = None) -> Callable:
+        """Decorator caching a function's result per argument set.
+        
+        Works for both sync and async functions; for coroutines the awaited
+        result is cached, not the coroutine object.
+        """
+        def decorator(func: Callable) -> Callable:
+            key_prefix = prefix or func.__qualname__
+            
+            def make_key(args, kwargs) -> str:
+                if kwargs:
+                    return f"{key_prefix}:{args!r}:{sorted(kwargs.items())!r}"
+                return f"{key_prefix}:{args!r}"
+            
+            if asyncio.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    key = make_key(args, kwargs)
+                    value = self.get(key, _MISSING)
+                    if value is _MISSING:
+                        value = await func(*args, **kwargs)
+                        self.set(key, value, ttl)
+                    return value
+                return async_wrapper
+            
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                value = self.get(key, _MISSING)
+                if value is _MISSING:
+                    value = func(*args, **kwargs)
+                    self.set(key, value, ttl)
+                return value
+            return wrapper
+        return decorator
@@ -9,6 +9,7 @@ from typing import Dict, Optional, List
 import aiohttp
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
+from solders.pubkey import Pubkey
 from ..monitoring.logger import BotLogger
 from ..config.manager import ConfigurationManager
 from dotenv import load_dotenv
@@ -22,14 +23,27 @@ class PhantomWallet:
         load_dotenv()  # Load environment variables
         self.client = None
         self.wallet_address = os.getenv('PHANTOM_WALLET_ADDRESS')
+        self.pubkey = self._parse_pubkey(self.wallet_address)
         self.connected = False
         
+    def _parse_pubkey(self, address: Optional[str]) -> Optional[Pubkey]:
+        """Decode the wallet address once so RPC calls can reuse it."""
+        if not address:
+            return None
+        try:
+            return Pubkey.from_string(address)
+        except ValueError as e:
+            self.logger.error(f"Invalid Phantom wallet address: {str(e)}")
+            return None
+            
     async def initialize(self) -> bool:
         """Initialize connection to Phantom wallet."""
         try:
             if not self.wallet_address:
                 self.logger.error("Phantom wallet address not configured")
                 return False
+            if not self.pubkey:
+                return False
                 
             # Initialize Solana client
             endpoint = os.getenv('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com')
@@ -49,11 +63,11 @@ class PhantomWallet:
     async def verify_connection(self) -> bool:
         """Verify connection to Phantom wallet."""
         try:
-            if not self.wallet_address or not self.client:
+            if not self.pubkey or not self.client:
                 return False
                 
             # Check if the wallet exists and is accessible
-            response = await self.client.get_account_info(self.wallet_address)
+            response = await self.client.get_account_info(self.pubkey)
             return response.get('result') is not None
             
         except Exception as e:
@@ -67,7 +81,7 @@ class PhantomWallet:
                 return []
                 
             response = await self.client.get_token_accounts_by_owner(
-                self.wallet_address,
+                self.pubkey,
                 {'programId': 'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA'}
             )
             
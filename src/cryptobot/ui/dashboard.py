@@ -3,6 +3,7 @@ import streamlit as st
 import asyncio
 from typing import Dict, List
 import json
+import numpy as np
 from datetime import datetime, timedelta
 
 from .dashboard_config import (
@@ -82,7 +83,8 @@ class Dashboard:
             
         # Calculate metrics
         pnl_series = [t['pnl'] for t in trades]
-        durations = [(t['exit_time'] - t['entry_time']).total_seconds() / 60 for t in trades]
+        # Sum the timedeltas and convert once instead of per trade
+        total_duration = sum((t['exit_time'] - t['entry_time'] for t in trades), timedelta())
         
         winning_trades = [t for t in trades if t['pnl'] > 0]
         losing_trades = [t for t in trades if t['pnl'] < 0]
@@ -94,35 +96,37 @@ class Dashboard:
             'max_drawdown': self._calculate_max_drawdown(pnl_series),
             'sharpe_ratio': self._calculate_sharpe_ratio(pnl_series),
             'win_loss_ratio': avg_win / avg_loss if avg_loss != 0 else 0,
-            'avg_duration': f"{sum(durations) / len(durations):.1f}m"
+            'avg_duration': f"{total_duration.total_seconds() / 60 / len(trades):.1f}m"
         }
         
     def _calculate_max_drawdown(self, pnl_series: List[float]) -> float:
         """Calculate maximum drawdown"""
-        peak = float('-inf')
-        max_dd = 0
-        
-        for pnl in pnl_series:
-            if pnl > peak:
-                peak = pnl
-            dd = (peak - pnl) / peak if peak > 0 else 0
-            max_dd = max(max_dd, dd)
+        if not pnl_series:
+            return 0
             
-        return max_dd * 100
+        # Running peak in one pass; drawdown only counts while the peak is positive
+        values = np.asarray(pnl_series, dtype=np.float64)
+        peak = np.maximum.accumulate(values)
+        drawdowns = np.zeros_like(values)
+        np.divide(peak - values, peak, out=drawdowns, where=peak > 0)
+        
+        return float(drawdowns.max()) * 100
         
     def _calculate_sharpe_ratio(self, pnl_series: List[float], risk_free_rate: float = 0.02) -> float:
         """Calculate Sharpe ratio"""
         if not pnl_series:
             return 0
             
-        returns = [p / abs(p) if p != 0 else 0 for p in pnl_series]
-        avg_return = sum(returns) / len(returns)
-        std_dev = (sum((r - avg_return) ** 2 for r in returns) / len(returns)) ** 0.5
+        # Each trade contributes its sign; mean and variance share one deviation array
+        returns = np.sign(np.asarray(pnl_series, dtype=np.float64))
+        avg_return = returns.mean()
+        deviations = returns - avg_return
+        std_dev = np.sqrt(np.dot(deviations, deviations) / returns.size)
         
         if std_dev == 0:
             return 0
             
-        return (avg_return - risk_free_rate) / std_dev
+        return float((avg_return - risk_free_rate) / std_dev)
         
     async def run(self):
         """Run the dashboard"""
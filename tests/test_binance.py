@@ -0,0 +1,116 @@
+"""Tests for Binance request signing"""
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from exchanges.binance import BinanceExchange
+
+# Example key and request from the Binance API documentation
+API_SECRET = 'NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j'
+PARAMS = {
+    'symbol': 'LTCBTC',
+    'side': 'BUY',
+    'type': 'LIMIT',
+    'timeInForce': 'GTC',
+    'quantity': 1,
+    'price': 0.1,
+    'recvWindow': 5000,
+    'timestamp': 1499827319559
+}
+SIGNATURE = 'c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71'
+
+@pytest.mark.asyncio
+async def test_signature_reuses_keyed_hmac():
+    """Test repeated signatures from the cached HMAC match the documented one"""
+    exchange = BinanceExchange({'api_key': 'key', 'api_secret': API_SECRET})
+    try:
+        assert exchange._generate_signature(PARAMS) == SIGNATURE
+        # Copying the template must leave it unchanged for the next request
+        assert exchange._generate_signature(PARAMS) == SIGNATURE
+        assert exchange._generate_signature({**PARAMS, 'timestamp': 1}) != SIGNATURE
+    finally:
+        await exchange.close()
+
+@pytest.mark.asyncio
+async def test_positions_fetch_tickers_in_one_request():
+    """Test held assets are priced from a single batched ticker request"""
+    exchange = BinanceExchange({'api_key': 'key', 'api_secret': API_SECRET})
+    exchange._private_request = AsyncMock(return_value={'balances': [
+        {'asset': 'SOL', 'free': '2.5', 'locked': '0.5'},
+        {'asset': 'BTC', 'free': '0', 'locked': '0'},
+        {'asset': 'ETH', 'free': '0', 'locked': '1'}
+    ]})
+    exchange.get_markets = AsyncMock(return_value={'SOLUSDT': {}, 'ETHUSDT': {}})
+    exchange._public_request = AsyncMock(return_value=[
+        {'symbol': 'ETHUSDT', 'lastPrice': '2500.5'},
+        {'symbol': 'SOLUSDT', 'lastPrice': '150.25'}
+    ])
+    try:
+        positions = await exchange.get_positions()
+    finally:
+        await exchange.close()
+
+    exchange._public_request.assert_awaited_once_with(
+        'GET', '/v3/ticker/24hr', {'symbols': '["SOLUSDT","ETHUSDT"]'}
+    )
+    assert [(p.symbol, p.amount, p.current_price) for p in positions] == [
+        ('SOL', Decimal('3.0'), Decimal('150.25')),
+        ('ETH', Decimal('1'), Decimal('2500.5'))
+    ]
+
+@pytest.mark.asyncio
+async def test_positions_skip_quote_asset_and_unlisted_pairs():
+    """Test USDT is valued at 1 and assets without a USDT pair are not requested"""
+    exchange = BinanceExchange({'api_key': 'key', 'api_secret': API_SECRET})
+    exchange._private_request = AsyncMock(return_value={'balances': [
+        {'asset': 'USDT', 'free': '100', 'locked': '0'},
+        {'asset': 'SOL', 'free': '2', 'locked': '0'},
+        {'asset': 'LDSOL', 'free': '1', 'locked': '0'}
+    ]})
+    exchange.get_markets = AsyncMock(return_value={'SOLUSDT': {}, 'SOLBTC': {}})
+    exchange._public_request = AsyncMock(return_value=[
+        {'symbol': 'SOLUSDT', 'lastPrice': '150.25'}
+    ])
+    try:
+        positions = await exchange.get_positions()
+    finally:
+        await exchange.close()
+
+    exchange._public_request.assert_awaited_once_with(
+        'GET', '/v3/ticker/24hr', {'symbols': '["SOLUSDT"]'}
+    )
+    assert [(p.symbol, p.amount, p.current_price) for p in positions] == [
+        ('USDT', Decimal('100'), Decimal('1')),
+        ('SOL', Decimal('2'), Decimal('150.25'))
+    ]
+
+@pytest.mark.asyncio
+async def test_account_shared_between_balance_and_positions():
+    """Test balances and positions read from one cached account request"""
+    exchange = BinanceExchange({'api_key': 'key', 'api_secret': API_SECRET})
+    exchange._private_request = AsyncMock(return_value={'balances': [
+        {'asset': 'SOL', 'free': '2', 'locked': '0'},
+        {'asset': 'BTC', 'free': '0', 'locked': '0'}
+    ]})
+    exchange.get_markets = AsyncMock(return_value={'SOLUSDT': {}})
+    exchange._public_request = AsyncMock(return_value=[
+        {'symbol': 'SOLUSDT', 'lastPrice': '150.25'}
+    ])
+    try:
+        balances = await exchange.get_balance()
+        positions = await exchange.get_positions()
+        assert exchange._private_request.await_count == 1
+
+        # A stale cache is refetched
+        await exchange._get_account(max_age=0)
+        assert exchange._private_request.await_count == 2
+    finally:
+        await exchange.close()
+
+    assert balances['SOL']['total'] == Decimal('2')
+    assert [position.symbol for position in positions] == ['SOL']
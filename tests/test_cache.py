@@ -0,0 +1,84 @@
+"""Tests for the in-memory cache"""
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from cryptobot.cache import SimpleCache
+
+@pytest.fixture
+def cache():
+    cache = SimpleCache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+def test_set_get_with_ttl(cache, monkeypatch):
+    """Test entries expire after their TTL"""
+    now = [100.0]
+    monkeypatch.setattr('cryptobot.cache.time.monotonic', lambda: now[0])
+
+    cache.set('price', 1.5, ttl=10)
+    assert cache.get('price') == 1.5
+
+    now[0] += 11
+    assert cache.get('price') is None
+    assert cache.get('missing') is None
+
+def test_cached_sync_function(cache):
+    """Test sync results are cached per argument set"""
+    calls = []
+
+    @cache.cached(ttl=60)
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    assert double(2) == 4
+    assert double(2) == 4
+    assert double(3) == 6
+    assert calls == [2, 3]
+
+@pytest.mark.asyncio
+async def test_cached_async_function(cache):
+    """Test awaited results are cached, not coroutines"""
+    calls = []
+
+    @cache.cached(ttl=60, prefix='balance')
+    async def get_balance(address):
+        calls.append(address)
+        return 10.0
+
+    assert await get_balance('abc') == 10.0
+    assert await get_balance('abc') == 10.0
+    assert calls == ['abc']
+
+def test_cached_none_result(cache):
+    """Test a None result is cached instead of treated as a miss"""
+    calls = []
+
+    @cache.cached(ttl=60)
+    def find_pool(symbol):
+        calls.append(symbol)
+        return None
+
+    assert find_pool('SOL') is None
+    assert find_pool('SOL') is None
+    assert calls == ['SOL']
+
+def test_eviction_bounds_size(cache, monkeypatch):
+    """Test expired then oldest entries are evicted past max_entries"""
+    monkeypatch.setattr(SimpleCache, 'max_entries', 10)
+    now = [100.0]
+    monkeypatch.setattr('cryptobot.cache.time.monotonic', lambda: now[0])
+
+    cache.set('stale', 1, ttl=1)
+    now[0] += 2
+    for i in range(10):
+        cache.set(f'key{i}', i)
+
+    assert cache.get('stale') is None
+    assert len(cache._cache) <= 10
+    assert cache.get('key9') == 9
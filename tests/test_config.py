@@ -0,0 +1,64 @@
+"""Tests for .env loading in Config"""
+import sys
+import os
+
+from dotenv import dotenv_values
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import Config
+
+def test_simple_env_matches_dotenv(tmp_path):
+    """Test plain KEY=VALUE files parse the same as python-dotenv"""
+    env_path = tmp_path / '.env'
+    env_path.write_text(
+        "# Network\n"
+        "NETWORK=devnet\n"
+        "\n"
+        "RPC_URL = https://api.devnet.solana.com\n"
+        "POSITION_SIZE=0.5  # fraction of balance\n"
+        "WALLET_NAME=\"main wallet\"\n"
+        "API_KEY='abc#123'\n"
+        "EMPTY=\n",
+        encoding='utf-8'
+    )
+
+    assert Config._parse_simple_env(env_path) == dotenv_values(env_path)
+
+def test_complex_env_falls_back_to_dotenv(tmp_path):
+    """Test files using interpolation or exports are left to python-dotenv"""
+    interpolated = tmp_path / 'interpolated.env'
+    interpolated.write_text("HOST=localhost\nURL=http://${HOST}:8080\n", encoding='utf-8')
+    exported = tmp_path / 'exported.env'
+    exported.write_text("export NETWORK=devnet\n", encoding='utf-8')
+
+    assert Config._parse_simple_env(interpolated) is None
+    assert Config._parse_simple_env(exported) is None
+    assert Config._parse_simple_env(tmp_path / 'missing.env') is None
+
+def test_fields_are_cast_with_defaults(tmp_path, monkeypatch):
+    """Test fields read from .env are cast and missing ones use defaults"""
+    (tmp_path / '.env').write_text("NETWORK=devnet\nRPC_TIMEOUT=10\nPOSITION_SIZE=0.5\n", encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    for name, _, _ in Config._FIELDS:
+        monkeypatch.delenv(name, raising=False)
+
+    config = Config()
+
+    assert config.NETWORK == 'devnet'
+    assert config.RPC_TIMEOUT == 10
+    assert config.POSITION_SIZE == 0.5
+    assert config.STOP_LOSS_PERCENT == 2.0
+    assert config.SLIPPAGE_BPS == 50
+    assert config.validate()
+
+def test_injected_environment_skips_env_file(tmp_path, monkeypatch):
+    """Test CRYPTOBOT_ENV_INJECTED=1 reads the environment without a .env file"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('CRYPTOBOT_ENV_INJECTED', '1')
+    monkeypatch.setenv('NETWORK', 'testnet')
+
+    config = Config()
+
+    assert config.NETWORK == 'testnet'
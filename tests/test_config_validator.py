@@ -0,0 +1,35 @@
+"""Unit tests for configuration validation"""
+
+from decimal import Decimal
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config_validator import ConfigValidator
+
+def test_results_do_not_share_findings():
+    """Test each validate_* call only reports its own errors and warnings"""
+    validator = ConfigValidator()
+
+    risk_result = validator.validate_risk_params(
+        max_position_size=Decimal('0.3'),
+        max_total_exposure=Decimal('0.6'),
+        max_drawdown=Decimal('0.05'),
+        risk_per_trade=Decimal('0.01')
+    )
+    trading_result = validator.validate_trading_params(
+        min_trade_interval=600,
+        max_daily_trades=10,
+        min_win_rate=Decimal('0.5'),
+        min_profit_factor=Decimal('2')
+    )
+
+    assert not risk_result.is_valid
+    assert len(risk_result.errors) == 1
+    assert len(risk_result.warnings) == 1
+
+    assert trading_result.is_valid
+    assert trading_result.errors == []
+    assert trading_result.warnings == []
@@ -0,0 +1,71 @@
+"""Tests for shared exchange interface logic"""
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from exchanges.base import ExchangeInterface, OrderBook
+
+@pytest.fixture
+def exchange():
+    """Exchange stub serving a fixed order book"""
+    exchange = Mock()
+    exchange.get_orderbook = AsyncMock(return_value=OrderBook(
+        bid_levels=[(Decimal('99'), Decimal('1')), (Decimal('98'), Decimal('2'))],
+        ask_levels=[(Decimal('101'), Decimal('1')), (Decimal('102'), Decimal('2')), (Decimal('105'), Decimal('5'))],
+        timestamp=datetime.now()
+    ))
+    exchange.get_market_impact_curve = (
+        lambda *args: ExchangeInterface.get_market_impact_curve(exchange, *args)
+    )
+    return exchange
+
+@pytest.mark.asyncio
+async def test_market_impact_walks_levels(exchange):
+    """Test impact uses the volume-weighted fill price across levels"""
+    # 1 @ 101 + 1.5 @ 102 -> average 101.6, 0.594% above the best ask
+    impact = await ExchangeInterface.get_market_impact(exchange, 'SOL/USDT', 'buy', Decimal('2.5'))
+    assert impact == pytest.approx(Decimal('0.6') / Decimal('101'))
+
+    impact = await ExchangeInterface.get_market_impact(exchange, 'SOL/USDT', 'sell', Decimal('1'))
+    assert impact == 0
+
+@pytest.mark.asyncio
+async def test_market_impact_without_liquidity(exchange):
+    """Test impact is infinite when the book can't fill the amount"""
+    impact = await ExchangeInterface.get_market_impact(exchange, 'SOL/USDT', 'sell', Decimal('3.5'))
+    assert impact == Decimal('inf')
+
+@pytest.mark.asyncio
+async def test_market_impact_curve_single_fetch(exchange):
+    """Test a sizing curve is evaluated from one order book fetch"""
+    amounts = [Decimal('1'), Decimal('2.5'), Decimal('8'), Decimal('9')]
+    curve = await ExchangeInterface.get_market_impact_curve(exchange, 'SOL/USDT', 'buy', amounts)
+
+    assert exchange.get_orderbook.await_count == 1
+    assert curve[0] == 0
+    assert curve[1] == pytest.approx(0.6 / 101)
+    # 1 @ 101 + 2 @ 102 + 5 @ 105 -> average 103.75
+    assert curve[2] == pytest.approx(2.75 / 101)
+    assert curve[3] == float('inf')
+
+def test_orderbook_decimal_levels_are_lazy():
+    """Test raw string levels fill the arrays and Decimals are built on first access"""
+    book = OrderBook(
+        bid_levels=[['99.5', '1.25'], ['99', '2']],
+        ask_levels=[],
+        timestamp=datetime.now()
+    )
+
+    assert book.bids_arr.tolist() == [[99.5, 1.25], [99.0, 2.0]]
+    assert book.asks_arr.shape == (0, 2)
+    assert book._bids is None
+
+    assert book.bids == [(Decimal('99.5'), Decimal('1.25')), (Decimal('99'), Decimal('2'))]
+    assert book.bids is book.bids
+    assert book.asks == []
@@ -0,0 +1,160 @@
+"""Tests for PhotonTrader RPC failover"""
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bot.photon_trader import PhotonTrader, fib_backoff
+
+PRIMARY = 'https://primary.example'
+BACKUP = 'https://backup.example'
+SPARE = 'https://spare.example'
+
+@pytest.fixture
+def trader():
+    """Trader with three RPC endpoints and a short hedge delay"""
+    return PhotonTrader({
+        'wallet': {
+            'max_retries': 3,
+            'primary_address': '5' * 44
+        },
+        'rpc': {
+            'primary': PRIMARY,
+            'fallbacks': [BACKUP, SPARE],
+            'timeout': 5,
+            'retries': 3,
+            'hedge_delay_ms': 50,
+            'helius': {'enabled': False, 'api_key': ''}
+        }
+    })
+
+def fake_endpoints(trader, behaviour):
+    """Replace make_rpc_request with per-endpoint (delay, outcome) fakes"""
+    calls, cancelled = [], []
+
+    async def make_rpc_request(endpoint, method, params):
+        calls.append(endpoint)
+        delay, outcome = behaviour[endpoint]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(endpoint)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    trader.make_rpc_request = make_rpc_request
+    return calls, cancelled
+
+@pytest.mark.asyncio
+async def test_race_fast_backup_beats_slow_primary(trader):
+    """Test a backup launched after the hedge delay wins over a slow primary"""
+    fake_endpoints(trader, {
+        PRIMARY: (1.0, {'result': 'primary'}),
+        BACKUP: (0, {'result': 'backup'}),
+        SPARE: (1.0, {'result': 'spare'})
+    })
+
+    index, response = await trader.race_rpc_request('getHealth', [])
+
+    assert index == 1
+    assert response == {'result': 'backup'}
+
+@pytest.mark.asyncio
+async def test_race_all_endpoints_fail(trader):
+    """Test errors, empty and error responses are skipped until none remain"""
+    fake_endpoints(trader, {
+        PRIMARY: (0, ConnectionError("refused")),
+        BACKUP: (0, None),
+        SPARE: (0, {'error': {'code': -32005}})
+    })
+
+    assert await trader.race_rpc_request('getHealth', []) == (None, None)
+
+@pytest.mark.asyncio
+async def test_race_cancels_losing_tasks(trader):
+    """Test the slow primary is cancelled and later hedges never launch"""
+    calls, cancelled = fake_endpoints(trader, {
+        PRIMARY: (1.0, {'result': 'primary'}),
+        BACKUP: (0, {'result': 'backup'}),
+        SPARE: (0, {'result': 'spare'})
+    })
+
+    index, _ = await trader.race_rpc_request('getHealth', [])
+    await asyncio.sleep(0.2)  # past the point the spare would have launched
+
+    assert index == 1
+    assert calls == [PRIMARY, BACKUP]
+    assert cancelled == [PRIMARY]
+
+def test_breaker_opens_after_three_failures(trader):
+    """Test an endpoint stays available for two failures and is skipped after three"""
+    with patch('bot.photon_trader.time.monotonic', return_value=1000.0):
+        trader._record_endpoint_result(PRIMARY, False)
+        trader._record_endpoint_result(PRIMARY, False)
+        assert trader._endpoint_available(PRIMARY)
+
+        trader._record_endpoint_result(PRIMARY, False)
+        assert not trader._endpoint_available(PRIMARY)
+        assert trader._endpoint_available(BACKUP)
+
+def test_breaker_cooldown_expires(trader):
+    """Test the cooldown is min(60, 2 ** fails) seconds"""
+    with patch('bot.photon_trader.time.monotonic', return_value=1000.0):
+        for _ in range(3):
+            trader._record_endpoint_result(PRIMARY, False)
+    assert trader._endpoint_health[PRIMARY]['skip_until'] == 1008.0
+
+    with patch('bot.photon_trader.time.monotonic', return_value=1007.9):
+        assert not trader._endpoint_available(PRIMARY)
+    with patch('bot.photon_trader.time.monotonic', return_value=1008.0):
+        assert trader._endpoint_available(PRIMARY)
+
+    # The cooldown keeps doubling but is capped at a minute
+    with patch('bot.photon_trader.time.monotonic', return_value=2000.0):
+        for _ in range(7):
+            trader._record_endpoint_result(PRIMARY, False)
+    assert trader._endpoint_health[PRIMARY]['skip_until'] == 2060.0
+
+def test_breaker_resets_on_success(trader):
+    """Test a success closes the breaker and restarts the failure count"""
+    with patch('bot.photon_trader.time.monotonic', return_value=1000.0):
+        for _ in range(3):
+            trader._record_endpoint_result(PRIMARY, False)
+        trader._record_endpoint_result(PRIMARY, True)
+        assert trader._endpoint_available(PRIMARY)
+
+        # Two new failures are again below the threshold
+        trader._record_endpoint_result(PRIMARY, False)
+        trader._record_endpoint_result(PRIMARY, False)
+        assert trader._endpoint_available(PRIMARY)
+
+def test_fib_backoff_delays_within_budget():
+    """Test delays follow the Fibonacci sequence and stop before the cap"""
+    delays = list(fib_backoff(0.05, 2.0))
+
+    assert delays == pytest.approx([0.05, 0.05, 0.1, 0.15, 0.25, 0.4, 0.65])
+    assert sum(delays) <= 2.0
+    assert list(fib_backoff(0.05, 0.04)) == []
+
+@pytest.mark.asyncio
+async def test_rpc_retries_stop_at_duration_budget(trader):
+    """Test retry sleeps use fib_backoff and never exceed retry_max_duration"""
+    trader.rpc_config['retries'] = 50
+    session = Mock()
+    session.post = Mock(side_effect=ConnectionError("refused"))
+    trader._get_session = AsyncMock(return_value=session)
+
+    with patch('bot.photon_trader.asyncio.sleep', new=AsyncMock()) as sleep:
+        assert await trader.make_rpc_request(PRIMARY, 'getHealth', []) is None
+
+    delays = [call.args[0] for call in sleep.await_args_list]
+    assert delays == pytest.approx([0.05, 0.05, 0.1, 0.15, 0.25, 0.4, 0.65])
+    assert sum(delays) <= 2.0
+    # The attempt after the last delay fails too, then the request gives up
+    assert session.post.call_count == len(delays) + 1
@@ -0,0 +1,103 @@
+"""Tests for WalletManager balance lookups"""
+import pytest
+import orjson
+from unittest.mock import AsyncMock, Mock
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bot.wallet_manager import WalletManager
+
+@pytest.fixture
+def wallet():
+    """Wallet manager with a keypair and a mocked RPC client"""
+    wallet = WalletManager({'rpc': {'primary': 'http://localhost:8899'}})
+    wallet.keypair = Keypair()
+    wallet.rpc = Mock()
+    return wallet
+
+def token_account(amount):
+    """jsonParsed token account holding amount"""
+    return Mock(data=Mock(parsed={'info': {'tokenAmount': {'amount': str(amount)}}}))
+
+@pytest.mark.asyncio
+async def test_token_balances_paged_by_100(wallet):
+    """Test mints are fetched 100 per call and bad entries don't sink the page"""
+    mints = [str(Pubkey.new_unique()) for _ in range(150)]
+
+    async def get_multiple_accounts(accounts):
+        start = 0 if len(accounts) == 100 else 100
+        value = [token_account(start + i) for i in range(len(accounts))]
+        if start == 0:
+            value[1] = Mock(data=b'raw account data')  # not a parsed token account
+            value[2] = None  # no associated token account
+        return Mock(value=value)
+
+    wallet.rpc.client.get_multiple_accounts_json_parsed = AsyncMock(side_effect=get_multiple_accounts)
+
+    balances = await wallet.get_token_balances(mints)
+
+    calls = wallet.rpc.client.get_multiple_accounts_json_parsed.await_args_list
+    assert [len(call.args[0]) for call in calls] == [100, 50]
+    assert balances[mints[0]] == 0.0
+    assert balances[mints[1]] == 0.0
+    assert balances[mints[2]] == 0.0
+    assert balances[mints[3]] == 3.0
+    assert balances[mints[149]] == 149.0
+
+@pytest.mark.asyncio
+async def test_token_balances_failed_page_keeps_others(wallet):
+    """Test an RPC error on one page leaves the other pages' balances intact"""
+    mints = [str(Pubkey.new_unique()) for _ in range(101)]
+    wallet.rpc.client.get_multiple_accounts_json_parsed = AsyncMock(side_effect=[
+        Exception("RPC timeout"),
+        Mock(value=[token_account(7)])
+    ])
+
+    balances = await wallet.get_token_balances(mints)
+
+    assert balances[mints[0]] == 0.0
+    assert balances[mints[100]] == 7.0
+
+class FakeResponse:
+    """aiohttp response stand-in returning a fixed JSON-RPC batch reply"""
+
+    def __init__(self, body):
+        self.body = orjson.dumps(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+@pytest.mark.asyncio
+async def test_batch_balance_error_not_cached(wallet):
+    """Test a failed getBalance in the batch doesn't cache a 0 SOL balance"""
+    mint = str(Pubkey.new_unique())
+    session = Mock()
+    session.post = Mock(return_value=FakeResponse([
+        {'jsonrpc': '2.0', 'id': 0, 'error': {'code': -32005, 'message': 'Node is behind'}},
+        {'jsonrpc': '2.0', 'id': 1, 'result': {'value': [
+            {'account': {'data': {'parsed': {'info': {'tokenAmount': {'amount': '42'}}}}}}
+        ]}}
+    ]))
+    wallet._get_session = AsyncMock(return_value=session)
+    wallet.rpc.client.get_balance = AsyncMock(return_value=Mock(value=2_500_000_000))
+
+    balances = await wallet.get_balances_batch([mint])
+
+    assert balances == {'SOL': 0.0, mint: 42.0}
+    assert wallet._balance_cache is None
+    # get_balance goes to the RPC instead of returning a cached 0
+    assert await wallet.get_balance() == 2.5